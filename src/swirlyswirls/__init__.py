@@ -44,7 +44,7 @@ The following components are involved:
             t: float
                 The emit duration of the emitter, mapped onto a 0-1 range
 
-            position: Vector2
+            position: tuple[float, float]
                 The position where the particle should be created.
 
             momentum: Vector2
@@ -55,7 +55,8 @@ The following components are involved:
        easy.
 
        The only parameter a zone receives is the `t` that is also passed into
-       the particle factory above.
+       the particle factory above.  The emitter requests all points of a tick
+       at once through `Zone.emit_batch`.
 
     3. The `Emitter` object that controls the creation of particles:
 
@@ -86,7 +87,7 @@ The following components are involved:
             def particle_factory(t, position, momentum, *groups):
                 e = ecs.create_entity()
                 ecs.add_component(e, 'sprite', MySprite(*groups))
-                ecs.add_component(e, 'position', position)
+                ecs.add_component(e, 'position', Vector2(position))
                 if momentum is not None:
                     ecs.add_component(e, 'momentum', momentum)
 
@@ -98,7 +99,7 @@ The following components are involved:
                 e = ecs.create_entity()
                 ecs.add_component(e, 'lifetime', Cooldown(lifetime))
                 ecs.add_component(e, 'sprite', MySprite(*groups))
-                ecs.add_component(e, 'position', position)
+                ecs.add_component(e, 'position', Vector2(position))
                 if momentum is not None:
                     ecs.add_component(e, 'momentum', momentum)
 
@@ -131,10 +132,16 @@ The following components are involved:
 
             ecs.run_all_systems(dt)
 
+If you need thousands of short lived particles that only differ in position,
+size and alpha, have a look at `swirlyswirls.ParticlePool`.  Instead of one
+entity per particle, it keeps all of them in a set of numpy arrays and updates
+them in one go.
+
 For more complex examples look at the the demos in `swirlyswirls.demos` and/or
 run `swirlyswirl-demo`, and inspect the `swirlyswirls.bubbles` module.
 
 """
 # flake8: noqa
-from .compsys import Emitter, Particle, emitter_system, particle_system
+from .compsys import Emitter, Particle, emitter_system, particle_system, particle_pool_system
+from .particle_pool import ParticlePool
 from .spritegroup import ReversedGroup
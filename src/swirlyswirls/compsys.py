@@ -1,14 +1,12 @@
+import numpy as np
 import tinyecs as ecs
 import swirlyswirls.zones
 
 from dataclasses import dataclass, InitVar
-from itertools import cycle
 
 from pgcooldown import Cooldown, LerpThing
 from pygame import Vector2
 
-_lerp     = lambda a, b, t: (1 - t) * a + b * t
-
 
 @dataclass(kw_only=True)
 class Emitter:
@@ -45,7 +43,7 @@ class Emitter:
     tick : float = 0.1
         The heartbeat of the emitter.
 
-    ticklist: list[float]
+    ticklist: list[float] = None
         Change the heartbeat every time it fires.  This list cycles.  Use it
         for bullet stacking in patterns, e.g.
 
@@ -70,7 +68,7 @@ class Emitter:
             t: float
                 The normalized lifetime of the emitter (e.g. to shrink
                 particle size relative to the age of the emitter)
-            position: Vector2
+            position: tuple[float, float]
                 The position where the particle is emitted
             momentum: Vector2
                 The momentum of the particle
@@ -85,7 +83,7 @@ class Emitter:
     """
     ept: LerpThing
     tick: InitVar[float] = 0.1
-    ticklist: InitVar[list[float]]
+    ticklist: InitVar[list[float]] = None
     total_emits: InitVar[int] = None
     zone: swirlyswirls.zones.Zone
     particle_factory: callable
@@ -93,9 +91,13 @@ class Emitter:
 
     def __post_init__(self, tick, ticklist, total_emits):
         self.tick = Cooldown(tick, cold=True)
-        self.ticker = cycle(ticklist) if ticklist else cycle([tick])
+        self._ticklist = tuple(ticklist) if ticklist else (tick,)
+        self._tick_i = 0
         self.remaining = total_emits if total_emits is not None else -1
 
+        # Built by `emitter_system` on the first heartbeat, see `_emitter_step`
+        self._step = None
+
 
 def emitter_system(dt, eid, emitter, position):
     """The management system for Emitter entities.
@@ -107,23 +109,30 @@ def emitter_system(dt, eid, emitter, position):
     On each `tick`, a number of entities are launched until `total_emits` is
     reached or `duration` has passed.
 
-    For every entity, the `emiter.zone` function is called without parameters.
-    It is expected to return
+    For every tick, `emitter.zone.emit_batch` is called once for all entities
+    to launch.  It is expected to return
+
+        1. an array of `position`s,
+        2. an array of `momentum`s.
 
-        1. a `position` Vector2,
-        2. a `momentum` Vector2.
+    A zone doesn't need to be derived from `swirlyswirls.zones.Zone`.  If it
+    has no `emit_batch`, its `emit` is called once per entity instead, and is
+    expected to return a `position`/`momentum` tuple.
 
     The `position` vector is expected to be relative to the `zone` anchor, so
     the `position` of the emitter needs to be added to it.
 
     This system doesn't require a momentum, but it checks if one is available.
+    The `lifetime` and `momentum` components of the emitter entity are looked
+    up once on the first heartbeat and then kept on the emitter, so they must
+    not be replaced afterwards (modifying them in place is fine).
     The momentum of the particle is constructed from the momentum the zone
     provided, and the momentum of the emitter, depending on
     `emitter.inherit_momentum` (see `swirlyswirls.Emitter`).
 
-    Both, `position` and `momentum` are passed into the `emitter.emit`
-    function, which is then expecte to create a particle entity with all
-    necessary components.
+    Both, `position` (as a tuple) and `momentum` (as a Vector2) are passed
+    into the `emitter.particle_factory` function, which is then expected to
+    create a particle entity with all necessary components.
 
     If `emitter.duration` (see `swirlyswirls.Emitter`) is non-zero and
     positive, emits are lerped between `vt0` and `vt1` (see
@@ -144,51 +153,96 @@ def emitter_system(dt, eid, emitter, position):
 
     """
 
-    if emitter.tick.hot:
+    tick = emitter.tick
+    if tick.hot:
         return
 
-    emitter.tick.reset(next(emitter.ticker))
+    ticklist = emitter._ticklist
+    i = emitter._tick_i
+    tick.reset(ticklist[i])
+    emitter._tick_i = (i + 1) % len(ticklist)
 
     if emitter.remaining == 0:
         return
 
-    ept = emitter.ept
-    # If we have a valid duration and it's cold, simply return
-    # If we have a valid duration that's hot, get t from it
-    # If duration is not valid, try to derive it from lifetime
-    # Finally, if all fails, default t to 0
-    if ept.duration.duration:
-        if ept.duration.cold:
-            return
-        else:
-            t = ept.duration.normalized
-    else:
-        if ecs.eid_has(eid, 'lifetime'):
-            t = ecs.comp_of_eid(eid, 'lifetime').normalized
+    step = emitter._step
+    if step is None:
+        step = emitter._step = _emitter_step(eid, emitter)
+
+    step(position)
+
+
+def _emitter_step(eid, emitter):
+    """Build the function doing the work of a single heartbeat of `emitter`.
+
+    Which components the emitter entity has and whether emits are limited
+    doesn't change over the lifetime of an emitter, so this is decided once
+    here instead of on every heartbeat.  `emitter.ept` and
+    `emitter.inherit_momentum` are read on every heartbeat, so they can be
+    changed at any time.
+
+    """
+    lifetime = ecs.comp_of_eid(eid, 'lifetime') if ecs.eid_has(eid, 'lifetime') else None
+
+    limited = emitter.remaining > 0
+    e_momentum = ecs.comp_of_eid(eid, 'momentum') if ecs.eid_has(eid, 'momentum') else None
+
+    def step(position):
+        ept = emitter.ept
+        # If we have a valid duration and it's cold, simply return
+        # If we have a valid duration that's hot, get t from it
+        # If duration is not valid, try to derive it from lifetime
+        # Finally, if all fails, default t to 0
+        duration = ept.duration
+        if duration.duration:
+            if duration.cold:
+                return
+            t = duration.normalized
+        elif lifetime is not None:
+            t = lifetime.normalized
         else:
             t = 0
 
-    emits = int(ept())
+        emits = int(ept())
 
-    if emitter.remaining > 0:
-        emits = min(emits, emitter.remaining)
-        emitter.remaining -= emits
+        if limited:
+            remaining = emitter.remaining
+            emits = min(emits, remaining)
+            emitter.remaining = remaining - emits
 
-    if emitter.inherit_momentum & 1 and ecs.eid_has(eid, 'momentum'):
-        e_momentum = ecs.comp_of_eid(eid, 'momentum')
-    else:
-        e_momentum = Vector2(0, 0)
+        zone = emitter.zone
+        emit_batch = getattr(zone, 'emit_batch', None)
+        if emit_batch is not None:
+            z_positions, z_momenta = emit_batch(emits, t)
+        else:
+            z_positions, z_momenta = _emit_each(zone, emits, t)
+
+        if not isinstance(z_positions, np.ndarray):
+            # Device arrays, e.g. from `ZoneCircleGPU`.  The particle factory
+            # runs on the host, so copy them back once per tick.
+            z_positions, z_momenta = z_positions.get(), z_momenta.get()
+
+        positions = z_positions + (position.x, position.y)
+
+        inherit = emitter.inherit_momentum
+        momenta = z_momenta if inherit & 2 else np.zeros_like(z_momenta)
+        if inherit & 1 and e_momentum is not None:
+            momenta = momenta + (e_momentum.x, e_momentum.y)
+
+        factory = emitter.particle_factory
+        for p, m in zip(positions.tolist(), momenta.tolist()):
+            factory(t=t, position=tuple(p), momentum=Vector2(m))
 
-    for i in range(emits):
-        z_position, z_momentum = emitter.zone.emit(t)
+    return step
 
-        momentum = Vector2()
-        if emitter.inherit_momentum & 1:
-            momentum += e_momentum
-        if emitter.inherit_momentum & 2:
-            momentum += z_momentum
 
-        emitter.particle_factory(t=t, position=position + z_position, momentum=momentum)
+def _emit_each(zone, n, t):
+    """`emit_batch` for zones that only provide `emit`."""
+    emits = [zone.emit(t) for _ in range(n)]
+    positions = np.array([tuple(p) for p, _ in emits], dtype=np.float32).reshape(n, 2)
+    momenta = np.array([tuple(m) for _, m in emits], dtype=np.float32).reshape(n, 2)
+
+    return positions, momenta
 
 
 @dataclass(kw_only=True)
@@ -209,11 +263,41 @@ class Particle:
     alpha: LerpThing
         Management of alpha
 
+    Which of the lerps are present is evaluated once on construction, so
+    don't add or remove them later on.  Replacing a lerp with another one is
+    fine.
+
     """
     rotate: LerpThing = None
     scale: LerpThing = None
     alpha: LerpThing = None
 
+    def __post_init__(self):
+        self._updater = _rsai_updater(self)
+
+
+def _rsai_updater(particle):
+    """Build a function pushing the present lerps of `particle` into an rsai.
+
+    The returned function is called as `updater(particle, rsai)`, and looks
+    the lerps up on `particle` on every call.
+
+    """
+    if particle.rotate is None and particle.scale is not None and particle.alpha is not None:
+        # By far the most common case, keep it free of any loop
+        def updater(particle, rsai):
+            rsai.scale = particle.scale.v
+            rsai.alpha = particle.alpha.v
+    else:
+        names = tuple(name for name in ('rotate', 'scale', 'alpha')
+                      if getattr(particle, name) is not None)
+
+        def updater(particle, rsai):
+            for name in names:
+                setattr(rsai, name, getattr(particle, name).v)
+
+    return updater
+
 
 def particle_system(dt, eid, particle):
     """This is a nop, all lerp things handle their updates automagically"""
@@ -241,12 +325,27 @@ def particle_rsai_system(dt, eid, particle, rsai):
 
     """
     rsai.lock = True
-    if particle.rotate is not None: rsai.rotate = particle.rotate.v
-    if particle.scale is not None: rsai.scale = particle.scale.v
-    if particle.alpha is not None: rsai.alpha = particle.alpha.v
+    particle._updater(particle, rsai)
     rsai.lock = False
 
 
+def particle_pool_system(dt, eid, particle_pool):
+    """Advance all particles of a `ParticlePool`.
+
+    This replaces the combination of `particle_system`,
+    `particle_rsai_system`, `momentum_system`, `lifetime_system` and
+    `sprite_system` for particles living in a pool.  Drawing is left to
+    `ParticlePool.draw`.
+
+    Parameters
+    ----------
+    particle_pool: swirlyswirls.ParticlePool
+        The pool to update.
+
+    """
+    particle_pool.step(dt)
+
+
 def container_system(dt, eid, container, position, momentum, sprite):
     """A system to make a sprite bonce off the edges of the screen.
 
@@ -254,6 +353,8 @@ def container_system(dt, eid, container, position, momentum, sprite):
     component.  It can still be used in test programs if you need to manage
     your sprites on screen.
 
+    For particles in a `ParticlePool`, see `ParticlePool.contain`.
+
     Parameters
     ----------
     container : pygame.Rect
@@ -272,16 +373,27 @@ def container_system(dt, eid, container, position, momentum, sprite):
     None
 
     """
-    if sprite.rect.left < container.left and momentum.x < 0:
-        momentum.x = -momentum.x
-        position.x += -2 * sprite.rect.left
-    elif sprite.rect.right > container.right and momentum.x > 0:
-        momentum.x = -momentum.x
-        position.x += 2 * (container.width - sprite.rect.right)
-
-    if sprite.rect.top < container.top and momentum.x < 0:
-        momentum.y = -momentum.y
-        position.y += -2 * sprite.rect.top
-    elif sprite.rect.bottom > container.bottom and momentum.y > 0:
-        momentum.y = -momentum.y
-        position.y += 2 * (container.height - sprite.rect.bottom)
+    rect = sprite.rect
+    mx, my = momentum.x, momentum.y
+
+    if rect.left < container.left:
+        dx = container.left - rect.left
+    elif rect.right > container.right:
+        dx = container.right - rect.right
+    else:
+        dx = 0
+
+    if dx * mx < 0:
+        momentum.x = -mx
+        position.x += 2 * dx
+
+    if rect.top < container.top:
+        dy = container.top - rect.top
+    elif rect.bottom > container.bottom:
+        dy = container.bottom - rect.bottom
+    else:
+        dy = 0
+
+    if dy * my < 0:
+        momentum.y = -my
+        position.y += 2 * dy
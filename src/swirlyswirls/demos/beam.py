@@ -19,18 +19,25 @@ class Demo(GameState):
         super().__init__(app, persist, parent=parent)
 
         self.title = 'Bubble Explosions'
-        self.cache = {}
-        self.group = sw.ReversedGroup()
+        self.pool = sw.ParticlePool(4096, swirlyswirls.particles.watersquabble_image_factory,
+                                    size=16,
+                                    scale_ease=in_quad,
+                                    alpha_ease=out_quad,
+                                    oldest_on_top=True)
+        self.pool.prerender()
         self.cooldown = Cooldown(3, cold=True)
 
         self.ecs_register_systems()
 
+        e = ecs.create_entity('particle-pool')
+        ecs.add_component(e, 'particle-pool', self.pool)
+
         self.emitter = partial(
             swcs.Emitter,
             inherit_momentum=2,
             zone=swirlyswirls.zones.ZoneBeam(v=(self.app.rect.width, 100), width=32),
-            particle_factory=partial(self.beam_particle_factory,
-                                     group=self.group, cache=self.cache)
+            particle_factory=self.pool.particle_factory(scale=(1, 1 / 8), alpha=(255, 0),
+                                                        lifetime=1)
         )
 
     def reset(self, persist=None):
@@ -52,10 +59,8 @@ class Demo(GameState):
 
         ecs.run_all_systems(dt)
 
-        self.group.update(dt)
-
-        sprites = len(self.group.sprites())
-        c = len(list(self.cache.keys()))
+        sprites = len(self.pool)
+        c = swirlyswirls.particles.squabble_image_factory.cache_info().currsize
         pygame.display.set_caption(f'{self.title} - time={pygame.time.get_ticks()/1000:.2f}  fps={self.app.clock.get_fps():.2f}  {sprites=}  {c=}')
 
     def draw(self, screen):
@@ -68,7 +73,7 @@ class Demo(GameState):
                              emitter.zone.v, width=5)
 
         ecs.run_system(1, draw_system, 'position', 'emitter', screen=self.app.screen)
-        self.group.draw(screen)
+        self.pool.draw(screen)
 
         pygame.display.flip()
 
@@ -76,9 +81,7 @@ class Demo(GameState):
     def ecs_register_systems():
         ecs.add_system(ecsc.lifetime_system, 'lifetime')
         ecs.add_system(swcs.emitter_system, 'emitter', 'position')
-        ecs.add_system(swcs.particle_rsai_system, 'particle', 'rsai')
-        ecs.add_system(ecsc.momentum_system, 'momentum', 'position')
-        ecs.add_system(ecsc.sprite_system, 'sprite', 'position')
+        ecs.add_system(swcs.particle_pool_system, 'particle-pool')
 
     @staticmethod
     def launch_emitter(position, emitter):
@@ -86,23 +89,3 @@ class Demo(GameState):
         ecs.add_component(e, 'emitter', emitter(ept=LerpThing(100, 10, 0.5)))
         ecs.add_component(e, 'position', Vector2(position))
         ecs.add_component(e, 'lifetime', Cooldown(0.5))
-
-    @staticmethod
-    def beam_particle_factory(t, position, momentum, group, cache):
-        e = ecs.create_entity()
-
-        def squabble_wrapper(rotate, scale, alpha):
-            size = 16 * scale
-            return swirlyswirls.particles.watersquabble_image_factory(size, alpha)
-
-        rsai = ecsc.RSAImage(None, image_factory=squabble_wrapper)
-
-        p = swcs.Particle(scale=LerpThing(1, 1 / 8, 1, ease=in_quad),
-                          alpha=LerpThing(255, 0, 1, ease=out_quad))
-
-        ecs.add_component(e, 'rsai', rsai)
-        ecs.add_component(e, 'particle', p)
-        ecs.add_component(e, 'lifetime', Cooldown(1))
-        ecs.add_component(e, 'sprite', ecsc.EVSprite(rsai, group))
-        ecs.add_component(e, 'position', Vector2(position))
-        ecs.add_component(e, 'momentum', momentum)
@@ -55,7 +55,7 @@ class Demo(GameState):
 
         self.group.update(dt)
 
-        sprites = len(self.group.sprites())
+        sprites = len(self.group)
         pygame.display.set_caption(f'{self.title} - time={pygame.time.get_ticks()/1000:.2f}  fps={self.app.clock.get_fps():.2f}  {sprites=}')
 
     def draw(self, screen):
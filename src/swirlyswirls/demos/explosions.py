@@ -19,8 +19,12 @@ class Demo(GameState):
         super().__init__(app, persist, parent=parent)
 
         self.title = 'Bubble Explosions'
-        self.cache = {}
-        self.group = sw.ReversedGroup()
+        self.pool = sw.ParticlePool(4096, swirlyswirls.particles.firesquabble_image_factory,
+                                    scale_ease=out_quint,
+                                    alpha_ease=out_quint,
+                                    oldest_on_top=True)
+        self.pool.prerender(max_scale=64)
+        self.pool.move = False
         self.momentum = False
         self.cooldown = Cooldown(5, cold=True)
 
@@ -28,27 +32,27 @@ class Demo(GameState):
 
         self.ecs_register_systems()
 
+        e = ecs.create_entity('particle-pool')
+        ecs.add_component(e, 'particle-pool', self.pool)
+
         self.emitters = [
             partial(
                 sw.Emitter,
                 zone=swirlyswirls.zones.ZoneCircle(r0=0, r1=16),
-                particle_factory=partial(self.explosion_particle_factory,
-                                         group=self.group, cache=self.cache,
-                                         max_size=16)
+                particle_factory=self.pool.particle_factory(
+                    scale=(16 / 4, 16), alpha=(255, 0), lifetime=0.75, speed=3)
             ),
             partial(
                 sw.Emitter,
                 zone=swirlyswirls.zones.ZoneCircle(r0=0, r1=32),
-                particle_factory=partial(self.explosion_particle_factory,
-                                         group=self.group, cache=self.cache,
-                                         max_size=32)
+                particle_factory=self.pool.particle_factory(
+                    scale=(32 / 4, 32), alpha=(255, 0), lifetime=0.75, speed=3)
             ),
             partial(
                 sw.Emitter,
                 zone=swirlyswirls.zones.ZoneCircle(r0=0, r1=64),
-                particle_factory=partial(self.explosion_particle_factory,
-                                         group=self.group, cache=self.cache,
-                                         max_size=64)
+                particle_factory=self.pool.particle_factory(
+                    scale=(64 / 4, 64), alpha=(255, 0), lifetime=0.75, speed=3)
             ),
         ]
 
@@ -64,10 +68,7 @@ class Demo(GameState):
         match e.type:
             case pygame.KEYDOWN if e.key == pygame.K_SPACE:
                 self.momentum = not self.momentum
-                if self.momentum:
-                    ecs.add_system(ecsc.momentum_system, 'momentum', 'position')
-                else:
-                    ecs.remove_system(ecsc.momentum_system)
+                self.pool.move = self.momentum
 
     def update(self, dt):
         """Update frame by delta time dt."""
@@ -82,10 +83,8 @@ class Demo(GameState):
 
         ecs.run_all_systems(dt)
 
-        self.group.update(dt)
-
-        sprites = len(self.group.sprites())
-        c = len(list(self.cache.keys()))
+        sprites = len(self.pool)
+        c = swirlyswirls.particles.squabble_image_factory.cache_info().currsize
         pygame.display.set_caption(f'{self.title} - time={pygame.time.get_ticks()/1000:.2f}  fps={self.app.clock.get_fps():.2f}  {sprites=}  {c=}')
 
     def draw(self, screen):
@@ -94,7 +93,7 @@ class Demo(GameState):
         screen.fill('black')
         screen.blit(self.label, (5, 5))
 
-        self.group.draw(screen)
+        self.pool.draw(screen)
 
         pygame.display.flip()
 
@@ -111,8 +110,7 @@ class Demo(GameState):
     def ecs_register_systems():
         ecs.add_system(ecsc.lifetime_system, 'lifetime')
         ecs.add_system(swcs.emitter_system, 'emitter', 'position')
-        ecs.add_system(swcs.particle_rsai_system, 'particle', 'rsai')
-        ecs.add_system(ecsc.sprite_system, 'sprite', 'position')
+        ecs.add_system(swcs.particle_pool_system, 'particle-pool')
 
     @staticmethod
     def launch_emitter(pos, emitter):
@@ -120,24 +118,3 @@ class Demo(GameState):
         ecs.add_component(e, 'emitter', emitter(ept=LerpThing(2, 5, 1)))
         ecs.add_component(e, 'position', Vector2(pos))
         ecs.add_component(e, 'lifetime', Cooldown(1))
-
-    @staticmethod
-    def explosion_particle_factory(t, position, momentum, group, cache, max_size):
-        e = ecs.create_entity()
-
-        def image_factory(rotate, scale, alpha):
-            size = max_size * scale
-            return swirlyswirls.particles.firesquabble_image_factory(size, alpha)
-
-        rsai = ecsc.RSAImage(None, image_factory=image_factory)
-
-        p = swcs.Particle(scale=LerpThing(1 / 4, 1, 0.75, ease=out_quint),
-                          alpha=LerpThing(255, 0, 0.75, ease=out_quint))
-
-        ecs.add_component(e, 'rsai', rsai)
-        ecs.add_component(e, 'particle', p)
-        ecs.add_component(e, 'lifetime', Cooldown(0.75))
-        ecs.add_component(e, 'sprite', ecsc.EVSprite(rsai, group))
-        ecs.add_component(e, 'position', Vector2(position))
-        ecs.add_component(e, 'momentum', momentum * 3)
-        ecs.add_component(e, 'cache', cache)
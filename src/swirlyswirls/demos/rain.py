@@ -6,14 +6,13 @@ import swirlyswirls.compsys as swcs
 import swirlyswirls.particles
 import swirlyswirls.zones
 
-from functools import partial
-
-from pgcooldown import Cooldown, LerpThing
+from pgcooldown import LerpThing
 from pygame import Vector2
 from pygamehelpers.framework import GameState
-from rpeasings import *  # noqa
+from rpeasings import out_cubic, out_quad
 
 
+@swirlyswirls.particles.cache_image_factory
 def draw_splash_bubble(size, alpha, highlight_color, base_color):
     surface = pygame.Surface((size, size))
 
@@ -29,36 +28,26 @@ def draw_splash_bubble(size, alpha, highlight_color, base_color):
     return surface
 
 
-def pond_particle_factory(t, position, momentum, group):
-    def image_factory(rotate, scale, alpha):
-        size = 128 * scale
-        return draw_splash_bubble(size, alpha,
-                                  base_color='aqua',
-                                  highlight_color='white')
-
-    rsai = ecsc.RSAImage(None, image_factory=image_factory)
-
-    p = swcs.Particle(scale=LerpThing(1 / 10, 1, 3, ease=out_cubic), # noqa: 405
-                      alpha=LerpThing(128, 0, 3, ease=out_quad))  # noqa: 405
-
-    e = ecs.create_entity()
-    ecs.add_component(e, 'rsai', rsai)
-    ecs.add_component(e, 'particle', p)
-    ecs.add_component(e, 'sprite', ecsc.EVSprite(rsai, group))
-    ecs.add_component(e, 'position', Vector2(position))
-    ecs.add_component(e, 'momentum', momentum)
-    ecs.add_component(e, 'lifetime', Cooldown(3))
-
-
 class Demo(GameState):
     def __init__(self, app, persist, parent=None):
         super().__init__(app, persist, parent=parent)
 
         self.title = 'Pond Demo'
-        self.group = sw.ReversedGroup()
+        image_factory = swirlyswirls.particles.image_template(draw_splash_bubble, 'white', 'aqua')
+        self.pool = sw.ParticlePool(1024, image_factory,
+                                    size=128,
+                                    scale_ease=out_cubic,
+                                    alpha_ease=out_quad,
+                                    oldest_on_top=True)
+        self.pool.prerender()
+        self.pool.move = False
         self.momentum = False
 
         self.ecs_register_systems()
+
+        e = ecs.create_entity('particle-pool')
+        ecs.add_component(e, 'particle-pool', self.pool)
+
         self.launch_emitter()
 
     def reset(self, persist=None):
@@ -74,9 +63,7 @@ class Demo(GameState):
         """Update frame by delta time dt."""
         ecs.run_all_systems(dt)
 
-        self.group.update(dt)
-
-        sprites = len(self.group.sprites())
+        sprites = len(self.pool)
         pygame.display.set_caption(f'{self.title} - time={pygame.time.get_ticks()/1000:.2f}  fps={self.app.clock.get_fps():.2f}  {sprites=}')
 
     def draw(self, screen):
@@ -84,15 +71,14 @@ class Demo(GameState):
 
         screen.fill('black')
 
-        self.group.draw(screen)
+        self.pool.draw(screen)
 
         pygame.display.flip()
 
     def ecs_register_systems(self):
         ecs.add_system(ecsc.lifetime_system, 'lifetime')
         ecs.add_system(swcs.emitter_system, 'emitter', 'position')
-        ecs.add_system(swcs.particle_rsai_system, 'particle', 'rsai')
-        ecs.add_system(ecsc.sprite_system, 'sprite', 'position')
+        ecs.add_system(swcs.particle_pool_system, 'particle-pool')
 
     def launch_emitter(self):
         r = self.app.rect.copy()
@@ -100,8 +86,8 @@ class Demo(GameState):
         emitter = sw.Emitter(
             ept=LerpThing(3, 1, 0),
             zone=swirlyswirls.zones.ZoneRect(r=r),
-            particle_factory=partial(pond_particle_factory,
-                                     group=self.group))
+            particle_factory=self.pool.particle_factory(
+                scale=(1 / 10, 1), alpha=(128, 0), lifetime=3))
 
         e = ecs.create_entity('emitter')
         ecs.add_component(e, 'emitter', emitter)
@@ -0,0 +1,386 @@
+"""A pool of particles, stored as a structure of arrays.
+
+The default way of swirlyswirls is to make every particle a full entity.
+That's flexible, but for thousands of short lived particles, each of them
+carrying half a dozen components, the per entity overhead dominates.
+
+The `ParticlePool` trades that flexibility for speed.  All particles of a pool
+share the same image factory and easing, and their state lives in one numpy
+array per attribute.  A single `step` advances all of them at once.
+
+"""
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+try:
+    import rpeasings
+except ImportError:  # pragma: no cover
+    rpeasings = None
+
+__all__ = ['ParticlePool', 'ease_id',
+           'EASE_LINEAR', 'EASE_IN_QUAD', 'EASE_OUT_QUAD', 'EASE_OUT_CUBIC',
+           'EASE_IN_QUINT', 'EASE_OUT_QUINT']
+
+EASE_LINEAR = 0
+EASE_IN_QUAD = 1
+EASE_OUT_QUAD = 2
+EASE_OUT_CUBIC = 3
+EASE_IN_QUINT = 4
+EASE_OUT_QUINT = 5
+EASE_COUNT = 6
+
+EASE_LUT_SIZE = 1024
+
+
+def _ease(ease, t):
+    """Apply the easing `ease` (one of the `EASE_*` ids) to `t`.
+
+    Works on floats and on numpy arrays alike.
+    """
+    if ease == EASE_IN_QUAD:
+        return t * t
+    elif ease == EASE_OUT_QUAD:
+        return t * (2 - t)
+    elif ease == EASE_OUT_CUBIC:
+        u = 1 - t
+        return 1 - u * u * u
+    elif ease == EASE_IN_QUINT:
+        return t * t * t * t * t
+    elif ease == EASE_OUT_QUINT:
+        u = 1 - t
+        return 1 - u * u * u * u * u
+    return t
+
+
+def ease_id(ease):
+    """Map an easing function to its `EASE_*` id.
+
+    Parameters
+    ----------
+    ease: int | callable | None
+        Either already an `EASE_*` id, None for linear, or one of the
+        supported `rpeasings` functions (`in_quad`, `out_quad`, `out_cubic`,
+        `in_quint`, `out_quint`).
+
+    Returns
+    -------
+    int
+
+    Raises
+    ------
+    ValueError if `ease` has no compiled equivalent.
+
+    """
+    if ease is None:
+        return EASE_LINEAR
+    if isinstance(ease, int) and 0 <= ease < EASE_COUNT:
+        return ease
+    try:
+        return _EASE_IDS[ease]
+    except (KeyError, TypeError):
+        raise ValueError(f'No EASE_* id for easing {ease!r}') from None
+
+
+_EASE_IDS = {}
+if rpeasings is not None:
+    _EASE_IDS.update({
+        rpeasings.null: EASE_LINEAR,
+        rpeasings.in_quad: EASE_IN_QUAD,
+        rpeasings.out_quad: EASE_OUT_QUAD,
+        rpeasings.out_cubic: EASE_OUT_CUBIC,
+        rpeasings.in_quint: EASE_IN_QUINT,
+        rpeasings.out_quint: EASE_OUT_QUINT,
+    })
+
+# One row of pre-eased t values per EASE_* id, for the numpy code path
+_EASE_LUT = np.stack([_ease(ease, np.linspace(0, 1, EASE_LUT_SIZE, dtype=np.float32))
+                      for ease in range(EASE_COUNT)])
+
+
+def _step_np(dt, move_dt, alive, dead, age, lifetime,
+             position_x, position_y, momentum_x, momentum_y,
+             scale_t0, scale_t1, scale, scale_ease,
+             alpha_t0, alpha_t1, alpha, alpha_ease):
+    np.add(age, dt, out=age, where=alive)
+    np.logical_and(alive, age >= lifetime, out=dead)
+    alive &= ~dead
+
+    t = np.zeros_like(age)
+    np.divide(age, lifetime, out=t, where=alive)
+    np.minimum(t, 1, out=t)
+    lut_idx = (t * (EASE_LUT_SIZE - 1) + 0.5).astype(np.int32)
+
+    scale[:] = scale_t0 + (scale_t1 - scale_t0) * _EASE_LUT[scale_ease, lut_idx]
+    alpha[:] = alpha_t0 + (alpha_t1 - alpha_t0) * _EASE_LUT[alpha_ease, lut_idx]
+
+    if move_dt:
+        position_x += momentum_x * move_dt
+        position_y += momentum_y * move_dt
+
+
+if numba is not None:
+    _ease = numba.njit(fastmath=True, cache=True)(_ease)
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _step_jit(dt, move_dt, alive, dead, age, lifetime,
+                  position_x, position_y, momentum_x, momentum_y,
+                  scale_t0, scale_t1, scale, scale_ease,
+                  alpha_t0, alpha_t1, alpha, alpha_ease):
+        for i in numba.prange(len(alive)):
+            if not alive[i]:
+                continue
+
+            age[i] += dt
+            if age[i] >= lifetime[i]:
+                alive[i] = False
+                dead[i] = True
+                continue
+
+            t = age[i] / lifetime[i]
+
+            scale[i] = scale_t0[i] + (scale_t1[i] - scale_t0[i]) * _ease(scale_ease, t)
+            alpha[i] = alpha_t0[i] + (alpha_t1[i] - alpha_t0[i]) * _ease(alpha_ease, t)
+
+            position_x[i] += momentum_x[i] * move_dt
+            position_y[i] += momentum_y[i] * move_dt
+
+    _step = _step_jit
+else:
+    _step = _step_np
+
+
+class ParticlePool:
+    """A fixed capacity pool of particles.
+
+    Particles are stored column wise, one numpy array per attribute.  Free
+    slots are managed on a stack, so spawning and killing particles never
+    allocates.
+
+    Use `particle_factory` to create the `particle_factory` of an `Emitter`,
+    or call `spawn` from within your own one, then call `step` and `draw` once
+    per frame, or register the `swirlyswirls.compsys.particle_pool_system`.
+
+    Parameters
+    ----------
+    capacity: int
+        Maximum number of concurrently living particles.  If the pool is
+        exhausted, `spawn` silently drops new particles.
+
+    image_factory: callable
+        A function receiving `size` and `alpha`, returning a
+        `pygame.surface.Surface`, e.g.
+        `swirlyswirls.particles.bubble_image_factory`.
+
+    size: float = 1
+        The lerped scale of a particle is multiplied with this before it is
+        passed into `image_factory`.
+
+    scale_ease, alpha_ease: int | callable = EASE_LINEAR
+        Easing put over `t` of the scale and alpha lerps, one of the `EASE_*`
+        constants of this module or a matching `rpeasings` function, see
+        `ease_id`.
+
+    oldest_on_top: bool = False
+        Draw older particles over newer ones, see
+        `swirlyswirls.ReversedGroup`.
+
+    Attributes
+    ----------
+    position_x, position_y,
+    momentum_x, momentum_y,
+    age, lifetime,
+    scale_t0, scale_t1,
+    alpha_t0, alpha_t1,
+    scale, alpha: numpy.ndarray
+        The particle attributes, one array of `capacity` length each.  Only
+        slots marked in `alive` are valid.
+
+    alive: numpy.ndarray
+        Boolean mask of the slots in use.
+
+    move: bool = True
+        If False, momentum is not applied to the positions.
+
+    """
+    def __init__(self, capacity, image_factory, size=1,
+                 scale_ease=EASE_LINEAR, alpha_ease=EASE_LINEAR, oldest_on_top=False):
+        self.capacity = capacity
+        self.image_factory = image_factory
+        self.size = size
+        self.scale_ease = ease_id(scale_ease)
+        self.alpha_ease = ease_id(alpha_ease)
+        self.oldest_on_top = oldest_on_top
+        self.move = True
+
+        def column():
+            return np.zeros((capacity,), dtype=np.float32)
+
+        self.position_x = column()
+        self.position_y = column()
+        self.momentum_x = column()
+        self.momentum_y = column()
+        self.age = column()
+        self.lifetime = column()
+        self.scale_t0 = column()
+        self.scale_t1 = column()
+        self.alpha_t0 = column()
+        self.alpha_t1 = column()
+        self.scale = column()
+        self.alpha = column()
+        self.alive = np.zeros((capacity,), dtype=bool)
+        self._dead = np.zeros((capacity,), dtype=bool)
+
+        # Stack of free slots, the top is at self._free - 1
+        self.free_list = np.arange(capacity - 1, -1, -1)
+        self._free = capacity
+
+    def __len__(self):
+        return self.capacity - self._free
+
+    def prerender(self, max_scale=1):
+        """Render the particle images for all sizes up front.
+
+        This only works if `image_factory` was created by
+        `swirlyswirls.particles.image_template` from a cached image factory,
+        otherwise it does nothing.
+
+        Parameters
+        ----------
+        max_scale: float = 1
+            The largest scale a particle of this pool will reach.
+
+        """
+        prerender = getattr(self.image_factory, 'prerender', None)
+        if prerender is not None:
+            prerender(max_size=self.size * max_scale)
+
+    def spawn(self, position, momentum, scale, alpha, lifetime):
+        """Create a new particle.
+
+        Parameters
+        ----------
+        position, momentum: Vector2 | tuple[float, float]
+            Initial position and momentum of the particle.
+
+        scale: tuple[float, float]
+            Scale at the start and the end of the particle's lifetime.
+
+        alpha: tuple[float, float]
+            Alpha at the start and the end of the particle's lifetime.
+
+        lifetime: float
+            Time in seconds until the particle dies.
+
+        Returns
+        -------
+        int | None
+            The slot of the new particle, or None if the pool is exhausted.
+
+        """
+        if not self._free:
+            return None
+
+        self._free -= 1
+        i = self.free_list[self._free]
+
+        self.position_x[i], self.position_y[i] = position
+        self.momentum_x[i], self.momentum_y[i] = momentum
+        self.age[i] = 0
+        self.lifetime[i] = lifetime
+        self.scale_t0[i], self.scale_t1[i] = scale
+        self.alpha_t0[i], self.alpha_t1[i] = alpha
+        self.scale[i] = scale[0]
+        self.alpha[i] = alpha[0]
+        self.alive[i] = True
+
+        return i
+
+    def particle_factory(self, scale, alpha, lifetime, speed=1):
+        """Create a `particle_factory` for an `Emitter` that spawns into this pool.
+
+        Parameters
+        ----------
+        scale, alpha, lifetime:
+            See `spawn`.
+
+        speed: float = 1
+            Factor for the momentum handed over by the emitter.
+
+        Returns
+        -------
+        callable
+
+        """
+        spawn = self.spawn
+
+        if speed == 1:
+            def factory(t, position, momentum):
+                spawn(position, momentum, scale, alpha, lifetime)
+        else:
+            def factory(t, position, momentum):
+                spawn(position, momentum * speed, scale, alpha, lifetime)
+
+        return factory
+
+    def step(self, dt):
+        """Advance all particles by `dt` and free the dead ones.
+
+        Aging, killing, easing and moving all happen in a single pass over
+        the pool.
+
+        If `numba` is installed, this runs as a compiled, parallel loop,
+        otherwise as vectorized numpy operations, with easing taken from a
+        lookup table.
+
+        """
+        _step(dt, dt if self.move else 0.0, self.alive, self._dead, self.age, self.lifetime,
+              self.position_x, self.position_y, self.momentum_x, self.momentum_y,
+              self.scale_t0, self.scale_t1, self.scale, self.scale_ease,
+              self.alpha_t0, self.alpha_t1, self.alpha, self.alpha_ease)
+
+        dead = np.flatnonzero(self._dead)
+        if len(dead):
+            self._dead[dead] = False
+            self.free_list[self._free:self._free + len(dead)] = dead
+            self._free += len(dead)
+
+    def contain(self, container):
+        """Bounce particles off the edges of `container`.
+
+        This is the pool version of `swirlyswirls.compsys.container_system`,
+        using the particle centers instead of sprite rects.
+
+        Parameters
+        ----------
+        container: pygame.Rect
+            The bounding box for the particles.
+
+        """
+        alive = self.alive
+        for position, momentum, lo, hi in (
+                (self.position_x, self.momentum_x, container.left, container.right),
+                (self.position_y, self.momentum_y, container.top, container.bottom)):
+            # Distance back into the container, 0 if inside
+            d = np.clip(position, lo, hi) - position
+            hit = alive & (d * momentum < 0)
+            momentum[hit] = -momentum[hit]
+            position[hit] += 2 * d[hit]
+
+    def draw(self, surface):
+        """Blit all living particles onto `surface`."""
+        idx = np.flatnonzero(self.alive)
+        order = np.argsort(self.age[idx])
+        idx = idx[order] if self.oldest_on_top else idx[order[::-1]]
+
+        factory = self.image_factory
+        images = [factory(scale, alpha)
+                  for scale, alpha in zip((self.scale[idx] * self.size).tolist(),
+                                          self.alpha[idx].tolist())]
+        centers = zip(self.position_x[idx].tolist(), self.position_y[idx].tolist())
+        surface.blits([(image, image.get_rect(center=center))
+                       for image, center in zip(images, centers)],
+                      doreturn=False)
@@ -1,20 +1,129 @@
 import pygame
 
-from functools import partial
-from random import random
+from functools import lru_cache, wraps
+from random import random, randrange
 from pygame import Vector2
 
+MAX_SIZE = 128
+ALPHA_STEP = 8
+SHARD_VARIANTS = 16
 
+
+def _size_bucket(size):
+    return min(max(int(size), 1), MAX_SIZE)
+
+
+def _alpha_bucket(alpha):
+    # Round to the nearest bucket, and make the topmost one fully opaque
+    return min((int(alpha) + ALPHA_STEP // 2) // ALPHA_STEP * ALPHA_STEP, 255)
+
+
+def cache_image_factory(factory):
+    """Memoize an image factory.
+
+    Particles change their size and alpha continuously, so drawing a fresh
+    surface for every frame of every particle is expensive.  This decorator
+    rounds `size` down to an int between 1 and `MAX_SIZE`, and `alpha` to the
+    nearest multiple of `ALPHA_STEP`, with 255 as the topmost bucket, and
+    caches the generated surfaces on these buckets.
+
+    The factory is only called once per size, with full alpha.  The other
+    alpha buckets are copies of that surface with their surface alpha set, so
+    the factory must apply `alpha` through `Surface.set_alpha` as the factories
+    in this module do.
+
+    All other arguments of the factory must be hashable, e.g. color names or
+    tuples instead of `pygame.Color` objects.
+
+    Note, that the returned surfaces are shared, don't modify them.
+
+    The `cache_info` and `cache_clear` functions of the underlying
+    `functools.lru_cache` are available on the decorated function.  Use
+    `prerender(*args, max_size=MAX_SIZE)` on it to render all sizes up front
+    instead of during the first frames.
+
+    """
+    @lru_cache(maxsize=MAX_SIZE * 4)
+    def render(size, *args, **kwargs):
+        return factory(size, 255, *args, **kwargs)
+
+    # Room for every size/alpha bucket of a single set of arguments.  All
+    # argument sets in use, e.g. several color pairs, share this.
+    @lru_cache(maxsize=MAX_SIZE * (256 // ALPHA_STEP + 1))
+    def cached(size, alpha, *args, **kwargs):
+        surface = render(size, *args, **kwargs).copy()
+        surface.set_alpha(alpha)
+        return surface
+
+    def prerender(*args, max_size=MAX_SIZE, **kwargs):
+        for size in range(1, min(int(max_size), MAX_SIZE) + 1):
+            render(size, *args, **kwargs)
+
+    @wraps(factory)
+    def wrapper(size, alpha, *args, **kwargs):
+        return cached(_size_bucket(size), _alpha_bucket(alpha), *args, **kwargs)
+
+    wrapper.cached = cached
+    wrapper.cache_info = cached.cache_info
+    wrapper.prerender = prerender
+
+    def cache_clear():
+        render.cache_clear()
+        cached.cache_clear()
+
+    wrapper.cache_clear = cache_clear
+
+    return wrapper
+
+
+def image_template(factory, *args):
+    """Bind `args` to an image factory.
+
+    This works like `partial(factory, *args)`, giving you a factory that only
+    receives `size` and `alpha`, but for factories decorated with
+    `cache_image_factory`, it directly calls into the cache, skipping the
+    wrapper and partial call layers.  In that case, the template also has a
+    `prerender(max_size=MAX_SIZE)` function, see `cache_image_factory`.
+
+        red_circle = image_template(circle_image_factory, 'red')
+
+    Parameters
+    ----------
+    factory: callable
+        The image factory.
+
+    *args:
+        Positional arguments following `size` and `alpha`.
+
+    Returns
+    -------
+    callable
+
+    """
+    cached = getattr(factory, 'cached', None)
+    if cached is None:
+        def template(size, alpha):
+            return factory(size, alpha, *args)
+    else:
+        def template(size, alpha):
+            return cached(_size_bucket(size), _alpha_bucket(alpha), *args)
+
+        template.prerender = lambda max_size=MAX_SIZE: factory.prerender(*args, max_size=max_size)
+
+    return template
+
+
+@cache_image_factory
 def default_image_factory(size, alpha, width=1, color='white'):
     """An image factory for squares.
 
     This is mostly a placeholder for particle classes, but it has basic
     customization for prototyping.
 
-    The `particle_system` will only offer size and alpha.  Make a `partial`
-    from this, if you need e.g. a different color.
+    The `particle_system` will only offer size and alpha.  Use
+    `image_template` on this, if you need e.g. a different color.
 
-        red_square = partial(default_image_factory, color='red')
+        red_square = image_template(default_image_factory, 1, 'red')
 
     Then pass this to the `Particle` object.
 
@@ -45,16 +154,17 @@ def default_image_factory(size, alpha, width=1, color='white'):
     return surface
 
 
+@cache_image_factory
 def circle_image_factory(size, alpha, color='white', width=1):
     """An image factory for circles.
 
     This is mostly a placeholder for particle classes, but it has basic
     customization for prototyping.
 
-    The `particle_system` will only offer size and alpha.  Make a `partial`
-    from this, if you need e.g. a different color.
+    The `particle_system` will only offer size and alpha.  Use
+    `image_template` on this, if you need e.g. a different color.
 
-        red_square = partial(default_image_factory, color='red')
+        red_circle = image_template(circle_image_factory, 'red')
 
     Then pass this to the `Particle` object.
 
@@ -87,9 +197,11 @@ def circle_image_factory(size, alpha, color='white', width=1):
     return surface
 
 
-disk_image_factory = partial(circle_image_factory, filled=True)
+disk_image_factory = image_template(circle_image_factory, 'white', 0)
+disk_image_factory.__doc__ = 'See `circle_image_factory`, filled white.'
 
 
+@cache_image_factory
 def bubble_image_factory(size, alpha, base_color='lightblue', highlight_color='lightcyan'):
     """Image factory for bubbles.
 
@@ -126,22 +238,17 @@ def bubble_image_factory(size, alpha, base_color='lightblue', highlight_color='l
     return surface
 
 
-waterbubble_image_factory = partial(bubble_image_factory,
-                                   base_color='lightblue',
-                                   highlight_color='white')
+waterbubble_image_factory = image_template(bubble_image_factory, 'lightblue', 'white')
 waterbubble_image_factory.__doc__ = 'See `bubble_image_factory`, lightblue/white.'
 
-firebubble_image_factory = partial(bubble_image_factory,
-                                   base_color='orange',
-                                   highlight_color='yellow')
+firebubble_image_factory = image_template(bubble_image_factory, 'orange', 'yellow')
 firebubble_image_factory.__doc__ = 'See `bubble_image_factory`, orange/yellow.'
 
-poisonbubble_image_factory = partial(bubble_image_factory,
-                                     base_color='palegreen3',
-                                     highlight_color='palegreen1')
+poisonbubble_image_factory = image_template(bubble_image_factory, 'palegreen3', 'palegreen1')
 poisonbubble_image_factory.__doc__ = 'See `bubble_image_factory`, palegreen3/palegreen1.'
 
 
+@cache_image_factory
 def squabble_image_factory(size, alpha, base_color, highlight_color):
     """Image factory for square bubbles.
 
@@ -178,27 +285,43 @@ def squabble_image_factory(size, alpha, base_color, highlight_color):
     return surface
 
 
-watersquabble_image_factory = partial(squabble_image_factory,
-                                     base_color='lightblue',
-                                     highlight_color='white')
+watersquabble_image_factory = image_template(squabble_image_factory, 'lightblue', 'white')
 watersquabble_image_factory.__doc__ = 'See `squabble_image_factory`, lightblue/white.'
 
-firesquabble_image_factory = partial(squabble_image_factory,
-                                     base_color='orange',
-                                     highlight_color='yellow')
+firesquabble_image_factory = image_template(squabble_image_factory, 'orange', 'yellow')
 firesquabble_image_factory.__doc__ = 'See `squabble_image_factory`, orange/yellow.'
 
-poisonsquabble_image_factory = partial(squabble_image_factory,
-                                       base_color='palegreen3',
-                                       highlight_color='palegreen1')
+poisonsquabble_image_factory = image_template(squabble_image_factory, 'palegreen3', 'palegreen1')
 poisonsquabble_image_factory.__doc__ = 'See `squabble_image_factory`, palegreen3/palegreen1.'
 
 
+# Shards are cached per size and variant at full alpha only.  Caching the
+# alpha buckets too, like `cache_image_factory` does, would multiply the keys
+# by another 33, far more than any sensible cache holds, so alpha is applied
+# to a copy on every call instead.
+@lru_cache(maxsize=MAX_SIZE * SHARD_VARIANTS)
+def _shard_image(size, base_color, highlight_color, variant):
+    # `variant` only serves to cache several different shards per size
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    p0 = Vector2(random() * size, random() * size)
+    p1 = Vector2(random() * size, random() * size)
+    p2 = Vector2(random() * size, random() * size)
+    pygame.draw.line(surface, highlight_color, p0, p1, width=2)
+    pygame.draw.line(surface, highlight_color, p1, p2, width=2)
+    pygame.draw.line(surface, highlight_color, p2, p0, width=2)
+
+    return surface
+
+
 def shard_image_factory(size, alpha, base_color, highlight_color):
     """Image factory for random shards.
 
     A shard is a random triangle within a surface of size `size`.
 
+    Shards are cached with `SHARD_VARIANTS` different random triangles per
+    size, one of which is picked on every call.  The returned surface is a
+    copy with `alpha` applied.
+
     Parameters
     ----------
     size: int
@@ -216,32 +339,18 @@ def shard_image_factory(size, alpha, base_color, highlight_color):
     pygame.surface.Surface
 
     """
-    surface = pygame.Surface((size, size), pygame.SRCALPHA)
-    p0 = Vector2(random() * size, random() * size)
-    p1 = Vector2(random() * size, random() * size)
-    p2 = Vector2(random() * size, random() * size)
-    pygame.draw.line(surface, highlight_color, p0, p1, width=2)
-    pygame.draw.line(surface, highlight_color, p1, p2, width=2)
-    pygame.draw.line(surface, highlight_color, p2, p0, width=2)
-    p0.move(1, 0)
-    p1.move(1, 0)
-    p2.move(1, 0)
-    pygame.draw.line(surface, highlight_color, p0, p1, width=0)
-    pygame.draw.line(surface, highlight_color, p1, p2, width=0)
-    pygame.draw.line(surface, highlight_color, p2, p0, width=0)
+    surface = _shard_image(_size_bucket(size), base_color, highlight_color,
+                           randrange(SHARD_VARIANTS)).copy()
+    surface.set_alpha(alpha)
+
+    return surface
 
 
-watershard_image_factory = partial(shard_image_factory,
-                                   base_color='lightblue',
-                                   highlight_color='white')
+watershard_image_factory = image_template(shard_image_factory, 'lightblue', 'white')
 watershard_image_factory.__doc__ = 'See `shard_image_factory`, lightblue/white.'
 
-fireshard_image_factory = partial(shard_image_factory,
-                                  base_color='orange',
-                                  highlight_color='yellow')
+fireshard_image_factory = image_template(shard_image_factory, 'orange', 'yellow')
 fireshard_image_factory.__doc__ = 'See `shard_image_factory`, orange/yellow.'
 
-poisonshard_image_factory = partial(shard_image_factory,
-                                    base_color='palegreen3',
-                                    highlight_color='palegreen1')
+poisonshard_image_factory = image_template(shard_image_factory, 'palegreen3', 'palegreen1')
 poisonshard_image_factory.__doc__ = 'See `shard_image_factory`, palegreen3/palegreen1.'
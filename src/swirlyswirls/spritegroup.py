@@ -6,6 +6,26 @@ class ReversedGroup(pygame.sprite.Group):
 
     Use this, e.g. for the bubble effect, where the oldest sprites should be
     rendered over new ones.
+
+    The reversed order is cached and only rebuilt when sprites are added or
+    removed.
     """
+    def __init__(self, *sprites):
+        self._reversed = None
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._reversed = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._reversed = None
+
+    def _sprites_reversed(self):
+        if self._reversed is None:
+            self._reversed = list(reversed(self.spritedict))
+        return self._reversed
+
     def sprites(self):
-        return list(reversed(self.spritedict))
+        return list(self._sprites_reversed())
@@ -1,10 +1,20 @@
+import numpy as np
 import pygame
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, InitVar, field
+from dataclasses import dataclass, InitVar
+from math import cos, hypot, pi, sin, sqrt
 from random import random, triangular
 from pygame import Vector2
 
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+# Imported by the first `ZoneCircleGPU`, see `_import_cupy`
+cupy = None
+
 # See Freya Holmer "The simple yet powerful math we don't talk about":
 #     https://www.youtube.com/watch?v=R6UB7mVO3fY
 # This is the "official" lerp, but it's about 10% slower than the one with only
@@ -14,6 +24,246 @@ _lerp     = lambda a, b, t: t * (b - a) + a
 _inv_lerp = lambda a, b, v: (v - a) / (b - a)
 _remap    = lambda a0, a1, b0, b1, v: _lerp(b0, b1, _inv_lerp(a0, a1, v))
 
+_triangular = lambda: triangular(0, 1, mode=0.5)
+
+# (cos, sin) of full circle in SINCOS_SIZE steps, for the scalar emits.
+# Index it with `int(phi * _SINCOS_SCALE) & _SINCOS_MASK` for phi in degrees.
+SINCOS_SIZE = 4096
+_SINCOS_SCALE = SINCOS_SIZE / 360
+_SINCOS_MASK = SINCOS_SIZE - 1
+_SINCOS = tuple((cos(phi), sin(phi))
+                for phi in (2 * pi * i / SINCOS_SIZE for i in range(SINCOS_SIZE)))
+
+
+# Batch kernels for the `emit_batch` functions of the zones below.  These are
+# vectorized numpy code (`*_np`), or compiled loops (`*_jit`), if numba is
+# available.
+#
+# All kernels write into the preallocated `positions` and `momenta` arrays of
+# shape (n, 2) and return them.  The numpy versions additionally get `rnd`, a
+# (3, n) scratch array to draw their random numbers into, so a batch doesn't
+# allocate any temporary arrays.
+#
+# The numpy versions draw their random numbers from `_RNG`, the numba
+# versions use numba's own per thread generators.  Both are independent from
+# python's `random` module, so `random.seed` doesn't make batches reproducible.
+_RNG = np.random.default_rng()
+
+
+def _quantize(a, dtype):
+    # Integer targets get the points rounded instead of truncated towards 0.
+    # Only array methods are used here, so this works for cupy arrays too.
+    if np.dtype(dtype).kind in 'iu':
+        return a.round().astype(dtype)
+    return a.astype(dtype, copy=False)
+
+
+def _polar_to_cart(r, phi, out):
+    # Both trig functions write straight into the float32 output, in place
+    np.cos(phi, out=out[:, 0])
+    np.sin(phi, out=out[:, 1])
+    out *= r[:, None]
+
+    return out
+
+
+def _point_batch_np(positions, momenta, rnd, speed, variance, phi0, phi1):
+    m, phi = rnd[0], rnd[1]
+    _RNG.random(out=m, dtype=np.float32)
+    _RNG.random(out=phi, dtype=np.float32)
+
+    m *= speed * 2 * variance
+    m += speed * (1 - variance)
+    phi *= np.deg2rad(phi1 - phi0)
+    phi += np.deg2rad(phi0)
+
+    positions.fill(0)
+    _polar_to_cart(m, phi, momenta)
+
+    return positions, momenta
+
+
+def _line_batch_np(positions, momenta, rnd, vx, vy, speed_x, speed_y, variance):
+    p, m = rnd[0], rnd[1]
+    _RNG.random(out=p, dtype=np.float32)
+    _RNG.random(out=m, dtype=np.float32)
+
+    m *= 2 * variance
+    m += 1 - variance
+
+    np.multiply(p, vx, out=positions[:, 0])
+    np.multiply(p, vy, out=positions[:, 1])
+    np.multiply(m, speed_x, out=momenta[:, 0])
+    np.multiply(m, speed_y, out=momenta[:, 1])
+
+    return positions, momenta
+
+
+def _circle_batch_np(positions, momenta, rnd, r0, r1, phi0, phi1, area_uniform):
+    # position and momentum are identical, so `momenta` stays unused
+    r, phi = rnd[0], rnd[1]
+    _RNG.random(out=r, dtype=np.float32)
+    _RNG.random(out=phi, dtype=np.float32)
+
+    if area_uniform:
+        r *= r1 * r1 - r0 * r0
+        r += r0 * r0
+        np.sqrt(r, out=r)
+    else:
+        r *= r1 - r0
+        r += r0
+    phi *= np.deg2rad(phi1 - phi0)
+    phi += np.deg2rad(phi0)
+
+    _polar_to_cart(r, phi, positions)
+
+    return positions, positions
+
+
+def _import_cupy():
+    # Importing cupy initializes CUDA, so don't do that for everybody
+    # importing this module, but only once the GPU is actually used.
+    global cupy
+    if cupy is None:
+        try:
+            import cupy as module
+        except ImportError:
+            raise ImportError('ZoneCircleGPU needs cupy') from None
+        cupy = module
+
+    return cupy
+
+
+def _circle_batch_gpu(n, r0, r1, phi0, phi1, area_uniform):
+    # Same as `_circle_batch_np`, but with cupy.  There are no buffers kept
+    # around for this, cupy's memory pool already makes the allocations cheap.
+    r, phi = cupy.random.random((2, n), dtype=cupy.float32)
+
+    if area_uniform:
+        r *= r1 * r1 - r0 * r0
+        r += r0 * r0
+        cupy.sqrt(r, out=r)
+    else:
+        r *= r1 - r0
+        r += r0
+    phi *= np.deg2rad(phi1 - phi0)
+    phi += np.deg2rad(phi0)
+
+    positions = cupy.stack((cupy.cos(phi), cupy.sin(phi)), axis=1)
+    positions *= r[:, None]
+
+    return positions, positions
+
+
+def _rect_batch_np(positions, momenta, rnd, width, height, cx, cy):
+    _RNG.random(out=positions, dtype=np.float32)
+
+    positions -= 0.5
+    positions *= (width, height)
+    if cx == 0 and cy == 0:
+        return positions, positions
+
+    np.subtract(positions, (cx, cy), out=momenta)
+
+    return positions, momenta
+
+
+def _beam_batch_np(positions, momenta, rnd, vx, vy, wx, wy, nx, ny):
+    # (wx, wy) is the beam's width vector, already scaled to the full spread
+    p, m, m2 = rnd[0], rnd[1], rnd[2]
+    _RNG.random(out=p, dtype=np.float32)
+    _RNG.random(out=m, dtype=np.float32)
+    _RNG.random(out=m2, dtype=np.float32)
+
+    # The mean of two uniform randoms is triangular(0, 1, mode=0.5)
+    m += m2
+    m *= 0.5
+    m -= 0.5
+
+    np.multiply(p, vx, out=positions[:, 0])
+    np.multiply(p, vy, out=positions[:, 1])
+    np.multiply(m, wx, out=momenta[:, 0])
+    np.multiply(m, wy, out=momenta[:, 1])
+    momenta += (nx, ny)
+
+    return positions, momenta
+
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _point_batch_jit(positions, momenta, rnd, speed, variance, phi0, phi1):
+        for i in numba.prange(len(positions)):
+            m = speed * (1 + np.random.random() * 2 * variance - variance)
+            phi = np.deg2rad(phi0 + (phi1 - phi0) * np.random.random())
+            positions[i, 0] = 0
+            positions[i, 1] = 0
+            momenta[i, 0] = m * np.cos(phi)
+            momenta[i, 1] = m * np.sin(phi)
+
+        return positions, momenta
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _line_batch_jit(positions, momenta, rnd, vx, vy, speed_x, speed_y, variance):
+        for i in numba.prange(len(positions)):
+            p = np.random.random()
+            m = 1 + np.random.random() * 2 * variance - variance
+            positions[i, 0] = p * vx
+            positions[i, 1] = p * vy
+            momenta[i, 0] = m * speed_x
+            momenta[i, 1] = m * speed_y
+
+        return positions, momenta
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _circle_batch_jit(positions, momenta, rnd, r0, r1, phi0, phi1, area_uniform):
+        for i in numba.prange(len(positions)):
+            u = np.random.random()
+            if area_uniform:
+                r = np.sqrt((r1 * r1 - r0 * r0) * u + r0 * r0)
+            else:
+                r = (r1 - r0) * u + r0
+            phi = np.deg2rad((phi1 - phi0) * np.random.random() + phi0)
+            positions[i, 0] = r * np.cos(phi)
+            positions[i, 1] = r * np.sin(phi)
+
+        return positions, positions
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _rect_batch_jit(positions, momenta, rnd, width, height, cx, cy):
+        for i in numba.prange(len(positions)):
+            x = width * (np.random.random() - 0.5)
+            y = height * (np.random.random() - 0.5)
+            positions[i, 0] = x
+            positions[i, 1] = y
+            momenta[i, 0] = x - cx
+            momenta[i, 1] = y - cy
+
+        return positions, momenta
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _beam_batch_jit(positions, momenta, rnd, vx, vy, wx, wy, nx, ny):
+        for i in numba.prange(len(positions)):
+            p = np.random.random()
+            m = np.random.triangular(0, 0.5, 1) - 0.5
+            positions[i, 0] = p * vx
+            positions[i, 1] = p * vy
+            momenta[i, 0] = m * wx + nx
+            momenta[i, 1] = m * wy + ny
+
+        return positions, momenta
+
+    _point_batch = _point_batch_jit
+    _line_batch = _line_batch_jit
+    _circle_batch = _circle_batch_jit
+    _rect_batch = _rect_batch_jit
+    _beam_batch = _beam_batch_jit
+else:
+    _point_batch = _point_batch_np
+    _line_batch = _line_batch_np
+    _circle_batch = _circle_batch_np
+    _rect_batch = _rect_batch_np
+    _beam_batch = _beam_batch_np
+
 
 @dataclass(kw_only=True)
 class Zone(ABC):
@@ -30,7 +280,30 @@ class Zone(ABC):
     ----------
     The base class has no input attributes.  Extend as you please.
 
+    Zones can precompute values derived from their attributes in `_prepare`,
+    which is called from `__post_init__`, and again whenever one of the
+    attributes named in `_prepare_on` is assigned.  Changes made in place,
+    e.g. `zone.v.x = 5`, aren't noticed.
+
     """
+    _prepare_on = ()
+    _prepared = False
+    _capacity = -1
+    _rnd_capacity = -1
+
+    def __post_init__(self):
+        self._prepare()
+        self._prepared = True
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if self._prepared and name in self._prepare_on:
+            self._prepare()
+
+    # Optional hook, most zones have nothing to precompute
+    def _prepare(self):  # noqa: B027
+        """Precompute values derived from the attributes, see `Zone`."""
+
     @abstractmethod
     def emit(self, t=None):
         """Emit a coordinate/momentum tuple
@@ -55,6 +328,169 @@ class Zone(ABC):
         """
         raise NotImplementedError
 
+    def emit_raw(self, t=None):
+        """Emit a coordinate/momentum tuple as plain floats.
+
+        This saves the creation of the two `Vector2` objects of `emit`.  The
+        default implementation unpacks the result of `emit`, so override it
+        in your zone if you want the benefit.
+
+        Parameters
+        ----------
+        t
+            See `emit`.
+
+        Returns
+        -------
+        tuple[float, float, float, float]
+            x and y of the position, followed by x and y of the momentum.
+
+        """
+        position, momentum = self.emit(t)
+        return position.x, position.y, momentum.x, momentum.y
+
+    def emit_batch(self, n, t=None, dtype=None):
+        """Emit `n` coordinate/momentum tuples at once.
+
+        The default implementation calls `emit_raw` `n` times.  Zones that can
+        produce their points vectorized should implement `_emit_into` and
+        `_batchable` instead.  The zones of this module do so with numpy, as
+        long as their `rnd_*` functions are left at their defaults.
+
+        Parameters
+        ----------
+        n: int
+            Number of points to emit.
+
+        t
+            See `emit`.
+
+        dtype: numpy.dtype = None
+            Convert the results to this type, e.g. `np.float16` or `np.int16`
+            for a consumer with 16 bit storage.  The points are still
+            computed in float32, integer types get them rounded.  The default
+            is float32.
+
+        Returns
+        -------
+        positions: numpy.ndarray
+        momenta: numpy.ndarray
+            Arrays of shape (n, 2), see `emit` for their meaning.  Both may be
+            the same array, so don't modify them in place.  The zones of this
+            module reuse their arrays on the next call, so copy them if you
+            need to keep them around.
+
+        """
+        if self._batchable():
+            positions, momenta = self._emit_into(*self._buffers(n), t)
+        else:
+            emit_raw = self.emit_raw
+            raw = np.array([emit_raw(t) for _ in range(n)], dtype=np.float32).reshape(n, 4)
+            positions, momenta = raw[:, :2], raw[:, 2:]
+
+        if dtype is None or np.dtype(dtype) == np.float32:
+            return positions, momenta
+
+        if momenta is positions:
+            positions = momenta = _quantize(positions, dtype)
+        else:
+            positions, momenta = _quantize(positions, dtype), _quantize(momenta, dtype)
+
+        return positions, momenta
+
+    def emit_to_buffers(self, pos_out, mom_out, start, n, t=None):
+        """Emit `n` coordinate/momentum tuples into the caller's arrays.
+
+        This works like `emit_batch`, but writes the results into rows
+        `start` to `start + n` of `pos_out` and `mom_out`, e.g. the columns
+        of a particle store.  The zones of this module write there directly,
+        without going through their own buffers.
+
+        Parameters
+        ----------
+        pos_out, mom_out: numpy.ndarray
+            Arrays of shape (m, 2), with m >= start + n.  If they are
+            C-contiguous float32, the zones of this module write into them
+            directly, other types are converted like the `dtype` of
+            `emit_batch`.
+
+        start: int
+            First row to write to.
+
+        n: int
+            Number of points to emit.
+
+        t
+            See `emit`.
+
+        """
+        end = start + n
+        pos, mom = pos_out[start:end], mom_out[start:end]
+        if (self._batchable()
+                and pos.dtype == np.float32 and pos.flags.c_contiguous
+                and mom.dtype == np.float32 and mom.flags.c_contiguous):
+            positions, momenta = self._emit_into(pos, mom, self._rnd_buffer(n), t)
+            if momenta is positions:
+                mom[...] = positions
+        else:
+            positions, momenta = self.emit_batch(n, t)
+            pos[...] = _quantize(positions, pos.dtype)
+            mom[...] = _quantize(momenta, mom.dtype)
+
+    def _batchable(self):
+        """True if `_emit_into` can be used, see there."""
+        return False
+
+    def _emit_into(self, positions, momenta, rnd, t):
+        """Batch kernel of the zone, backing `emit_batch` and `emit_to_buffers`.
+
+        Fill `positions` and `momenta`, float32 arrays of shape (n, 2), with
+        `n` points, using `rnd`, a float32 scratch array of shape (3, n).
+        Return the filled arrays, which can be `positions` twice, if position
+        and momentum are identical.
+
+        Only called if `_batchable` returns True.
+
+        """
+        raise NotImplementedError
+
+    def _buffers(self, n):
+        """Get the batch buffers of this zone for `n` emits.
+
+        The buffers are kept on the zone and grow as needed, so a batch of a
+        size seen before doesn't allocate.
+
+        Returns
+        -------
+        positions, momenta: numpy.ndarray
+            float32 arrays of shape (n, 2)
+
+        rnd: numpy.ndarray
+            A float32 scratch array of shape (3, n)
+
+        """
+        if n > self._capacity:
+            capacity = max(n, 2 * self._capacity)
+            self._positions = np.empty((capacity, 2), dtype=np.float32)
+            self._momenta = np.empty((capacity, 2), dtype=np.float32)
+            self._capacity = capacity
+
+        return self._positions[:n], self._momenta[:n], self._rnd_buffer(n)
+
+    def _rnd_buffer(self, n):
+        """Get only the `rnd` scratch buffer of `_buffers`.
+
+        This is kept apart from the other buffers, so `emit_to_buffers`
+        doesn't allocate position and momentum buffers it doesn't use.
+
+        """
+        if n > self._rnd_capacity:
+            capacity = max(n, 2 * self._rnd_capacity)
+            self._rnd = np.empty((3, capacity), dtype=np.float32)
+            self._rnd_capacity = capacity
+
+        return self._rnd[:, :n]
+
 
 @dataclass(kw_only=True)
 class ZonePoint(Zone):
@@ -67,9 +503,8 @@ class ZonePoint(Zone):
 
     Parameters
     ----------
-    speed: Vector2 = Vector2(0, 0)
-        An optional momentum to launch with.  This vector is randomly scaled
-        between 0 and 1.
+    speed: float = 0
+        An optional speed to launch with, the length of the momentum.
 
     variance : float = 0..1
         The length of the momentum vector will be scaled by a random between
@@ -96,12 +531,20 @@ class ZonePoint(Zone):
 
 
     """
-    speed: Vector2 = field(default_factory=lambda: Vector2())
+    speed: float = 0
     variance: float = 0
     phi0: float = 0
     phi1: float = 360
     rnd_m: callable = random
 
+    _prepare_on = ('speed', 'variance', 'phi0', 'phi1')
+
+    def _prepare(self):
+        self._m0 = self.speed * (1 - self.variance)
+        self._dm = self.speed * 2 * self.variance
+        self._i0 = self.phi0 * _SINCOS_SCALE
+        self._di = (self.phi1 - self.phi0) * _SINCOS_SCALE
+
     def emit(self, t=None):
         """Emit a single point.
 
@@ -109,14 +552,28 @@ class ZonePoint(Zone):
         function always returns Vector2(0, 0).
 
         """
-        momentum = Vector2(self.speed, 0) * (1 + self.rnd_m() * 2 * self.variance - self.variance)
-        momentum.rotate_ip(_lerp(self.phi0, self.phi1, self.rnd_m()))
+        _, _, mx, my = self.emit_raw(t)
+        return Vector2(), Vector2(mx, my)
+
+    def emit_raw(self, t=None):
+        """Like `emit`, but returning plain floats, see `Zone.emit_raw`."""
+        rnd_m = self.rnd_m
+        m = self._dm * rnd_m() + self._m0
+        c, s = _SINCOS[int(self._di * rnd_m() + self._i0) & _SINCOS_MASK]
+
+        return 0.0, 0.0, m * c, m * s
+
+    def _batchable(self):
+        return self.rnd_m is random
 
-        return Vector2(0, 0), momentum
+    def _emit_into(self, positions, momenta, rnd, t):
+        # The compiled kernel only takes plain numbers
+        return _point_batch(positions, momenta, rnd, float(self.speed), float(self.variance),
+                            float(self.phi0), float(self.phi1))
 
 
 @dataclass(kw_only=True)
-class ZoneLine:
+class ZoneLine(Zone):
     """A zone emitting around on a line.
 
     Parameters
@@ -156,6 +613,7 @@ class ZoneLine:
     def __post_init__(self, v, speed):
         self.v = Vector2(v)
         self.speed = Vector2(speed) if speed else Vector2()
+        super().__post_init__()
 
     def emit(self, t=None):
         """Emit a point along the line.
@@ -175,9 +633,24 @@ class ZoneLine:
 
         """
 
-        v = self.v * self.rnd_p()
-        momentum = self.speed * (1 + self.rnd_m() * 2 * self.variance - self.variance)
-        return v, momentum
+        px, py, mx, my = self.emit_raw(t)
+        return Vector2(px, py), Vector2(mx, my)
+
+    def emit_raw(self, t=None):
+        """Like `emit`, but returning plain floats, see `Zone.emit_raw`."""
+        p = self.rnd_p()
+        m = 1 + self.rnd_m() * 2 * self.variance - self.variance
+        v, speed = self.v, self.speed
+        return v.x * p, v.y * p, speed.x * m, speed.y * m
+
+    def _batchable(self):
+        return self.rnd_p is random and self.rnd_m is random
+
+    def _emit_into(self, positions, momenta, rnd, t):
+        # The compiled kernel only takes plain numbers
+        v, speed = self.v, self.speed
+        return _line_batch(positions, momenta, rnd, float(v.x), float(v.y),
+                           float(speed.x), float(speed.y), float(self.variance))
 
 
 @dataclass(kw_only=True)
@@ -194,6 +667,11 @@ class ZoneCircle(Zone):
         Start and end angle of the circular zone.  If you only want to emit
         from a half circle, set these to 0 and 180 or 90 and 270.
 
+    area_uniform: bool = False
+        If True, points are distributed evenly over the area of the zone.  By
+        default, the radius is evenly distributed instead, which makes the
+        points cluster towards the center.
+
     rnd_p, rnd_m:
         Alternative random functions, e.g. if you want a gauss distribution
         instead of a normal random value.
@@ -211,9 +689,19 @@ class ZoneCircle(Zone):
     r1: float = 64
     phi0: float = 0
     phi1: float = 360
+    area_uniform: bool = False
     rnd_p: callable = random
     rnd_m: callable = random
 
+    _prepare_on = ('r0', 'r1', 'phi0', 'phi1')
+
+    def _prepare(self):
+        self._dr = self.r1 - self.r0
+        self._r0sq = self.r0 * self.r0
+        self._dr2 = self.r1 * self.r1 - self._r0sq
+        self._i0 = self.phi0 * _SINCOS_SCALE
+        self._di = (self.phi1 - self.phi0) * _SINCOS_SCALE
+
     def emit(self, t=None):
         """Emit a coordinate/momentum tuple
 
@@ -232,12 +720,82 @@ class ZoneCircle(Zone):
             With this zone, always identical to `position`.
 
         """
-        r = (self.r1 - self.r0) * self.rnd_p() + self.r0
-        phi = (self.phi1 - self.phi0) * random() + self.phi0
-        v = Vector2(r, 0).rotate(phi)
-
+        px, py, _, _ = self.emit_raw(t)
+        v = Vector2(px, py)
         return v, v
 
+    def emit_raw(self, t=None):
+        """Like `emit`, but returning plain floats, see `Zone.emit_raw`."""
+        u = self.rnd_p()
+        r = sqrt(self._dr2 * u + self._r0sq) if self.area_uniform else self._dr * u + self.r0
+        c, s = _SINCOS[int(self._di * random() + self._i0) & _SINCOS_MASK]
+        x, y = r * c, r * s
+
+        return x, y, x, y
+
+    def _batchable(self):
+        return self.rnd_p is random
+
+    def _emit_into(self, positions, momenta, rnd, t):
+        # The compiled kernel only takes plain numbers
+        return _circle_batch(positions, momenta, rnd, float(self.r0), float(self.r1),
+                             float(self.phi0), float(self.phi1), bool(self.area_uniform))
+
+
+@dataclass(kw_only=True)
+class ZoneCircleGPU(ZoneCircle):
+    """A `ZoneCircle` computing its batches on the GPU.
+
+    This needs `cupy`.  `emit_batch` returns cupy arrays, so a consumer also
+    living on the GPU can use them without a round trip through host memory.
+    For anything else, the transfer back will most likely eat up the gain,
+    and the kernel launches only pay off for batches of some 10k points, so
+    stick to `ZoneCircle` for normal particle counts.
+
+    `emit` and `emit_raw` still run on the CPU, `emit_to_buffers` accepts
+    cupy and numpy arrays.  The zone works with an `Emitter`, but as its
+    particle factory runs on the host, the emitter copies every batch back,
+    which leaves nothing to gain.  Use `emit_to_buffers` into cupy arrays
+    instead.
+
+    Parameters
+    ----------
+    See `ZoneCircle`.
+
+    Attributes
+    ----------
+    See Parameters.
+
+    """
+    def __post_init__(self):
+        _import_cupy()
+        super().__post_init__()
+
+    def emit_batch(self, n, t=None, dtype=None):
+        """Like `Zone.emit_batch`, but returning cupy arrays."""
+        if self.rnd_p is random:
+            positions, momenta = _circle_batch_gpu(n, self.r0, self.r1, self.phi0, self.phi1,
+                                                   self.area_uniform)
+        else:
+            positions, momenta = Zone.emit_batch(self, n, t)
+            positions, momenta = cupy.asarray(positions), cupy.asarray(momenta)
+
+        if dtype is None or np.dtype(dtype) == np.float32:
+            return positions, momenta
+
+        return _quantize(positions, dtype), _quantize(momenta, dtype)
+
+    def emit_to_buffers(self, pos_out, mom_out, start, n, t=None):
+        """Like `Zone.emit_to_buffers`, for cupy or numpy arrays."""
+        positions, momenta = self.emit_batch(n, t)
+        for out, a in ((pos_out, positions), (mom_out, momenta)):
+            if not isinstance(out, cupy.ndarray):
+                a = a.get()
+            out[start:start + n] = _quantize(a, out.dtype)
+
+    def _batchable(self):
+        return False
+
 
 @dataclass(kw_only=True)
 class ZoneRing(Zone):
@@ -309,21 +867,38 @@ class ZoneRing(Zone):
             With this zone, always identical to `position`.
 
         """
+        px, py, _, _ = self.emit_raw(t)
+        v = Vector2(px, py)
+        return v, v
+
+    def emit_raw(self, t=None):
+        """Like `emit`, but returning plain floats, see `Zone.emit_raw`."""
         r_min = _lerp(self.r_min_t0, self.r_min_t1, t)
         r_max = _lerp(self.r_max_t0, self.r_max_t1, t)
         r = _lerp(r_min, r_max, self.rnd_p())
 
         phi_min = _lerp(self.phi_min_t0, self.phi_min_t1, t)
         phi_max = _lerp(self.phi_max_t0, self.phi_max_t1, t)
-        phi = _lerp(phi_min, phi_max, self.rnd_p())
+        c, s = _SINCOS[int(_lerp(phi_min, phi_max, self.rnd_p()) * _SINCOS_SCALE) & _SINCOS_MASK]
+        x, y = r * c, r * s
 
-        v = Vector2(r, 0).rotate(phi)
+        return x, y, x, y
 
-        return v, v
+    def _batchable(self):
+        return self.rnd_p is random
+
+    def _emit_into(self, positions, momenta, rnd, t):
+        # The compiled kernel only takes plain numbers
+        return _circle_batch(positions, momenta, rnd,
+                             float(_lerp(self.r_min_t0, self.r_min_t1, t)),
+                             float(_lerp(self.r_max_t0, self.r_max_t1, t)),
+                             float(_lerp(self.phi_min_t0, self.phi_min_t1, t)),
+                             float(_lerp(self.phi_max_t0, self.phi_max_t1, t)),
+                             False)
 
 
 @dataclass(kw_only=True)
-class ZoneRect:
+class ZoneRect(Zone):
     """A rectangular zone.
 
     Use this e.g. to emit particles all over the screen.
@@ -331,7 +906,8 @@ class ZoneRect:
     Parameters
     ----------
     r: pygame.rect.Rect
-        The rect to emit from
+        The rect to emit from.  Its size and center are read when it is
+        assigned, so assign a new rect instead of moving it in place.
 
     rnd_p, rnd_m:
         Alternative random functions, e.g. if you want a gauss distribution
@@ -349,6 +925,13 @@ class ZoneRect:
     rnd_p: callable = random
     rnd_m: callable = random
 
+    _prepare_on = ('r',)
+
+    def _prepare(self):
+        self._w, self._h = self.r.size
+        self._cx, self._cy = self.r.center
+        self._centered = self._cx == 0 and self._cy == 0
+
     def emit(self, t=None):
         """Emit a point within a rectangle.
 
@@ -368,17 +951,35 @@ class ZoneRect:
             A random point within the defined rectangle.
 
         momentum: Vector2
-            Same as position
+            The position relative to the center of `r`.  For a rect
+            centered on (0, 0), this is the same object as `position`.
 
         """
-        pos = Vector2(int(self.r.width * (self.rnd_p() - 0.5)),
-                      int(self.r.height * (self.rnd_p() - 0.5)))
-        momentum = pos - Vector2(self.r.center)
-        return pos, momentum
+        px, py, mx, my = self.emit_raw(t)
+        position = Vector2(px, py)
+        if self._centered:
+            return position, position
+
+        return position, Vector2(mx, my)
+
+    def emit_raw(self, t=None):
+        """Like `emit`, but returning plain floats, see `Zone.emit_raw`."""
+        rnd_p = self.rnd_p
+        x = self._w * (rnd_p() - 0.5)
+        y = self._h * (rnd_p() - 0.5)
+        return x, y, x - self._cx, y - self._cy
+
+    def _batchable(self):
+        return self.rnd_p is random
+
+    def _emit_into(self, positions, momenta, rnd, t):
+        # The compiled kernel only takes plain numbers
+        return _rect_batch(positions, momenta, rnd, float(self._w), float(self._h),
+                           float(self._cx), float(self._cy))
 
 
 @dataclass(kw_only=True)
-class ZoneBeam:
+class ZoneBeam(Zone):
     """A zone emitting around a line.
 
     Parameters
@@ -409,11 +1010,27 @@ class ZoneBeam:
     v: InitVar[Vector2 | tuple[float, float]]
     width: InitVar[float] = 32
     rnd_p: callable = random
-    rnd_m: callable = lambda: triangular(0, 1, mode=0.5)
+    rnd_m: callable = _triangular
 
     def __post_init__(self, v, width):
         self.v = Vector2(v)
-        self.w = Vector2(-self.v.y, self.v.x).normalize() * width
+        vx, vy = self.v
+        length = hypot(vx, vy)
+        if not length:
+            raise ValueError("Can't emit along a beam of length zero")
+        scale = width / length
+        self.w = Vector2(-vy * scale, vx * scale)
+        super().__post_init__()
+
+    _prepare_on = ('v', 'w')
+
+    def _prepare(self):
+        vx, vy = self.v
+        wx, wy = self.w
+        scale = 100 / hypot(vx, vy)
+        self._vx, self._vy = vx, vy
+        self._wx, self._wy = 4 * wx, 4 * wy
+        self._nx, self._ny = vx * scale, vy * scale
 
     def emit(self, t=None):
         """Emit a point along the line within `width` distance.
@@ -432,6 +1049,20 @@ class ZoneBeam:
             The perpendicular distance to the vector of the beam.
 
         """
-        v = self.v * self.rnd_p()
-        w = self.w * 4 * (self.rnd_m() - 0.5) + self.v.normalize() * 100
-        return v, w
+        px, py, mx, my = self.emit_raw(t)
+        return Vector2(px, py), Vector2(mx, my)
+
+    def emit_raw(self, t=None):
+        """Like `emit`, but returning plain floats, see `Zone.emit_raw`."""
+        p = self.rnd_p()
+        m = self.rnd_m() - 0.5
+        return (self._vx * p, self._vy * p,
+                self._wx * m + self._nx, self._wy * m + self._ny)
+
+    def _batchable(self):
+        return self.rnd_p is random and self.rnd_m is _triangular
+
+    def _emit_into(self, positions, momenta, rnd, t):
+        # The compiled kernel only takes plain numbers
+        return _beam_batch(positions, momenta, rnd, float(self._vx), float(self._vy),
+                           float(self._wx), float(self._wy), float(self._nx), float(self._ny))
@@ -0,0 +1,83 @@
+import pygame
+import pytest
+
+from pygame import Vector2
+
+from swirlyswirls.compsys import Particle, container_system, particle_rsai_system
+
+
+class Lerp:
+    """Stand-in for a `pgcooldown.LerpThing` with a fixed value."""
+    def __init__(self, v):
+        self.v = v
+
+
+class RSAImage:
+    def __init__(self):
+        self.lock = False
+        self.rotate = self.scale = self.alpha = None
+
+
+@pytest.mark.parametrize('names', [('scale', 'alpha'), ('rotate', 'scale', 'alpha'), ('alpha',)])
+def test_particle_rsai(names):
+    particle = Particle(**{name: Lerp(i + 1) for i, name in enumerate(names)})
+    rsai = RSAImage()
+
+    particle_rsai_system(0, 0, particle, rsai)
+
+    assert not rsai.lock
+    for i, name in enumerate(names):
+        assert getattr(rsai, name) == i + 1
+    for name in {'rotate', 'scale', 'alpha'} - set(names):
+        assert getattr(rsai, name) is None
+
+
+@pytest.mark.parametrize('names', [('scale', 'alpha'), ('rotate', 'scale', 'alpha')])
+def test_particle_rsai_replaced_lerp(names):
+    particle = Particle(**{name: Lerp(1) for name in names})
+    rsai = RSAImage()
+    particle_rsai_system(0, 0, particle, rsai)
+
+    for name in names:
+        setattr(particle, name, Lerp(5))
+    particle_rsai_system(0, 0, particle, rsai)
+
+    for name in names:
+        assert getattr(rsai, name) == 5
+
+
+class Sprite:
+    def __init__(self, center):
+        self.rect = pygame.Rect(0, 0, 10, 10)
+        self.rect.center = center
+
+
+# A container away from the origin, left/right 50/150, top/bottom 200/300
+CONTAINER = pygame.Rect(50, 200, 100, 100)
+
+
+@pytest.mark.parametrize('center, momentum, expected_position, expected_momentum', [
+    # inside
+    ((100, 250), (5, 5), (100, 250), (5, 5)),
+    # left edge, 3px over
+    ((52, 250), (-5, 5), (58, 250), (5, 5)),
+    # right edge, 4px over
+    ((149, 250), (5, 5), (141, 250), (-5, 5)),
+    # top edge, 3px over
+    ((100, 202), (5, -5), (100, 208), (5, 5)),
+    # bottom edge, 4px over
+    ((100, 299), (5, 5), (100, 291), (5, -5)),
+    # corner, over on both axes
+    ((52, 299), (-5, 5), (58, 291), (5, -5)),
+    # over the edges, but already moving back in
+    ((52, 299), (5, -5), (52, 299), (5, -5)),
+])
+def test_container_system(center, momentum, expected_position, expected_momentum):
+    sprite = Sprite(center)
+    position = Vector2(center)
+    momentum = Vector2(momentum)
+
+    container_system(0, 0, CONTAINER, position, momentum, sprite)
+
+    assert position == Vector2(expected_position)
+    assert momentum == Vector2(expected_momentum)
@@ -0,0 +1,154 @@
+import types
+
+import numpy as np
+import pytest
+import tinyecs as ecs
+
+import swirlyswirls.zones
+
+from pgcooldown import LerpThing
+from pygame import Vector2
+
+from swirlyswirls.compsys import Emitter, _emitter_step
+from swirlyswirls.zones import ZoneCircle, ZoneCircleGPU
+
+
+class DuckZone:
+    """A zone that only provides `emit`, without deriving from `Zone`."""
+    def emit(self, t=None):
+        return Vector2(1, 2), Vector2(3, 4)
+
+
+@pytest.fixture
+def particles():
+    ecs.reset()
+    yield []
+    ecs.reset()
+
+
+def run_step(zone, particles, emits=3, inherit_momentum=3):
+    def factory(t, position, momentum):
+        particles.append((position, momentum))
+
+    emitter = Emitter(ept=LerpThing(emits, emits, 0), zone=zone, particle_factory=factory,
+                      inherit_momentum=inherit_momentum)
+    eid = ecs.create_entity()
+    ecs.add_component(eid, 'momentum', Vector2(10, 0))
+
+    _emitter_step(eid, emitter)(Vector2(100, 100))
+
+
+def test_duck_typed_zone(particles):
+    run_step(DuckZone(), particles)
+
+    assert particles == [((101, 102), Vector2(13, 4))] * 3
+
+
+def test_duck_typed_zone_momentum(particles):
+    run_step(DuckZone(), particles, inherit_momentum=1)
+
+    assert particles == [((101, 102), Vector2(10, 0))] * 3
+
+
+def test_zone_batch(particles):
+    run_step(ZoneCircle(r0=0, r1=8), particles, emits=20, inherit_momentum=2)
+
+    assert len(particles) == 20
+    for position, momentum in particles:
+        assert isinstance(position, tuple)
+        assert isinstance(momentum, Vector2)
+        assert Vector2(position).distance_to((100, 100)) <= 8 + 1e-3
+        assert momentum.length() <= 8 + 1e-3
+
+
+class DeviceArray:
+    """Stand-in for a cupy array.
+
+    Like cupy, it refuses to mix with host data, so it has to be brought
+    back with `get`.
+
+    """
+    def __init__(self, a):
+        self.a = a
+
+    def get(self):
+        return self.a.copy()
+
+    def __iter__(self):
+        return (DeviceArray(row) for row in self.a)
+
+    def __getitem__(self, key):
+        return DeviceArray(self.a[key])
+
+    def __iadd__(self, other):
+        self.a += other.a if isinstance(other, DeviceArray) else other
+        return self
+
+    def __imul__(self, other):
+        self.a *= other.a if isinstance(other, DeviceArray) else other
+        return self
+
+    def __add__(self, other):
+        raise TypeError('Unsupported type')
+
+    def tolist(self):
+        raise AssertionError('Element wise transfer from the device')
+
+
+def stub_sqrt(a, out):
+    np.sqrt(a.a, out=out.a)
+    return out
+
+
+fake_cupy = types.SimpleNamespace(
+    ndarray=DeviceArray,
+    float32=np.float32,
+    random=types.SimpleNamespace(
+        random=lambda shape, dtype: DeviceArray(np.random.random(shape).astype(dtype))),
+    sqrt=stub_sqrt,
+    cos=lambda a: DeviceArray(np.cos(a.a)),
+    sin=lambda a: DeviceArray(np.sin(a.a)),
+    stack=lambda arrays, axis: DeviceArray(np.stack([a.a for a in arrays], axis=axis)),
+)
+
+
+def test_device_zone(particles, monkeypatch):
+    monkeypatch.setattr(swirlyswirls.zones, 'cupy', fake_cupy)
+    zone = ZoneCircleGPU(r0=4, r1=8)
+    assert isinstance(zone.emit_batch(3)[0], DeviceArray)
+
+    run_step(zone, particles, emits=20, inherit_momentum=3)
+
+    assert len(particles) == 20
+    for position, momentum in particles:
+        assert 4 - 1e-3 <= Vector2(position).distance_to((100, 100)) <= 8 + 1e-3
+        assert 4 - 1e-3 <= (momentum - (10, 0)).length() <= 8 + 1e-3
+
+
+def test_replace_ept(particles):
+    emitter = Emitter(ept=LerpThing(2, 2, 0), zone=DuckZone(),
+                      particle_factory=lambda t, position, momentum: particles.append(position))
+    step = _emitter_step(ecs.create_entity(), emitter)
+
+    step(Vector2())
+    assert len(particles) == 2
+
+    emitter.ept = LerpThing(5, 5, 0)
+    step(Vector2())
+    assert len(particles) == 7
+
+
+def test_change_inherit_momentum(particles):
+    def factory(t, position, momentum):
+        particles.append(momentum)
+
+    emitter = Emitter(ept=LerpThing(1, 1, 0), zone=DuckZone(), particle_factory=factory)
+    eid = ecs.create_entity()
+    ecs.add_component(eid, 'momentum', Vector2(10, 0))
+    step = _emitter_step(eid, emitter)
+
+    expected = {0: Vector2(0, 0), 1: Vector2(10, 0), 2: Vector2(3, 4), 3: Vector2(13, 4)}
+    for inherit_momentum in (3, 0, 2, 1, 3):
+        emitter.inherit_momentum = inherit_momentum
+        step(Vector2())
+        assert particles.pop() == expected[inherit_momentum]
@@ -0,0 +1,159 @@
+import numpy as np
+import pygame
+import pytest
+
+import swirlyswirls.particle_pool as particle_pool
+
+from swirlyswirls.particle_pool import ParticlePool, EASE_OUT_QUAD, EASE_IN_QUINT
+
+
+def image_factory(size, alpha):
+    return None
+
+
+def make_pool(capacity=8, **kwargs):
+    return ParticlePool(capacity, image_factory, **kwargs)
+
+
+def populate(pool):
+    rng = np.random.default_rng(42)
+    for _ in range(pool.capacity - 2):
+        pool.spawn(position=rng.uniform(0, 100, 2).tolist(),
+                   momentum=rng.uniform(-10, 10, 2).tolist(),
+                   scale=rng.uniform(0, 4, 2).tolist(),
+                   alpha=rng.uniform(0, 255, 2).tolist(),
+                   lifetime=float(rng.uniform(0.1, 1)))
+
+
+@pytest.mark.parametrize('move', [True, False])
+def test_step_numpy_matches_default(monkeypatch, move):
+    # Run the numpy kernel with numba forced off against the default kernel,
+    # which is the compiled one if numba is installed.
+    kwargs = dict(capacity=64, scale_ease=EASE_OUT_QUAD, alpha_ease=EASE_IN_QUINT)
+    default, numpy = make_pool(**kwargs), make_pool(**kwargs)
+    populate(default)
+    populate(numpy)
+    default.move = numpy.move = move
+
+    for _ in range(40):
+        default.step(0.03)
+        with monkeypatch.context() as m:
+            m.setattr(particle_pool, '_step', particle_pool._step_np)
+            numpy.step(0.03)
+
+        assert len(default) == len(numpy)
+        assert (default.alive == numpy.alive).all()
+        assert sorted(default.free_list[default._free:]) == sorted(numpy.free_list[numpy._free:])
+
+        alive = default.alive
+        for column in ('age', 'position_x', 'position_y'):
+            assert np.allclose(getattr(default, column)[alive], getattr(numpy, column)[alive])
+
+        # The numpy kernel eases through a lookup table
+        assert np.allclose(default.scale[alive], numpy.scale[alive], atol=0.02)
+        assert np.allclose(default.alpha[alive], numpy.alpha[alive], atol=1.5)
+
+
+def spawn(pool, position=(0, 0), momentum=(0, 0), lifetime=1, alpha=(255, 0)):
+    return pool.spawn(position=position, momentum=momentum, scale=(1, 2), alpha=alpha,
+                      lifetime=lifetime)
+
+
+def test_spawn():
+    pool = make_pool(capacity=4)
+
+    slot = spawn(pool, position=(1, 2), momentum=(3, 4))
+
+    assert len(pool) == 1
+    assert pool.alive[slot]
+    assert (pool.position_x[slot], pool.position_y[slot]) == (1, 2)
+    assert (pool.momentum_x[slot], pool.momentum_y[slot]) == (3, 4)
+    assert pool.scale[slot] == 1
+    assert pool.alpha[slot] == 255
+    assert pool.age[slot] == 0
+
+
+def test_spawn_full():
+    pool = make_pool(capacity=3)
+
+    slots = [spawn(pool) for _ in range(3)]
+
+    assert sorted(slots) == [0, 1, 2]
+    assert spawn(pool) is None
+    assert len(pool) == 3
+    assert pool.alive.all()
+
+
+def test_step_expiry_and_reuse():
+    pool = make_pool(capacity=3)
+    short = spawn(pool, lifetime=0.5)
+    long = spawn(pool, lifetime=2)
+
+    pool.step(0.25)
+    assert len(pool) == 2
+    assert pool.age[short] == pytest.approx(0.25)
+    assert pool.scale[short] == pytest.approx(1.5, abs=0.01)
+    assert pool.alpha[short] == pytest.approx(127.5, abs=0.5)
+
+    pool.step(0.25)
+    assert len(pool) == 1
+    assert not pool.alive[short]
+    assert pool.alive[long]
+
+    # Both free slots are handed out again, the expired one first
+    assert spawn(pool) == short
+    assert spawn(pool) not in (short, long)
+    assert spawn(pool) is None
+
+
+def test_step_move():
+    pool = make_pool()
+    slot = spawn(pool, position=(10, 20), momentum=(2, -4))
+
+    pool.step(0.5)
+    assert (pool.position_x[slot], pool.position_y[slot]) == (11, 18)
+
+    pool.move = False
+    pool.step(0.25)
+    assert (pool.position_x[slot], pool.position_y[slot]) == (11, 18)
+
+
+def test_contain():
+    pool = make_pool()
+    container = pygame.Rect(0, 0, 100, 100)
+    inside = spawn(pool, position=(50, 50), momentum=(-5, 5))
+    left = spawn(pool, position=(-3, 50), momentum=(-5, 5))
+    bottom = spawn(pool, position=(50, 104), momentum=(5, 5))
+    leaving = spawn(pool, position=(-3, 50), momentum=(5, 0))
+
+    pool.contain(container)
+
+    def state(slot):
+        return (pool.position_x[slot], pool.position_y[slot],
+                pool.momentum_x[slot], pool.momentum_y[slot])
+
+    assert state(inside) == (50, 50, -5, 5)
+    assert state(left) == (3, 50, 5, 5)
+    assert state(bottom) == (50, 96, 5, -5)
+    # Already moving back in, left alone
+    assert state(leaving) == (-3, 50, 5, 0)
+
+
+@pytest.mark.parametrize('oldest_on_top', [False, True])
+def test_draw_order(oldest_on_top):
+    drawn = []
+
+    def recording_factory(size, alpha):
+        drawn.append(round(alpha))
+        return pygame.Surface((2, 2))
+
+    pool = ParticlePool(8, recording_factory, oldest_on_top=oldest_on_top)
+    # Tell the particles apart by their constant alpha
+    for alpha in (10, 20, 30):
+        spawn(pool, alpha=(alpha, alpha), lifetime=10)
+        pool.step(0.1)
+
+    pool.draw(pygame.Surface((10, 10)))
+
+    # The last one drawn ends up on top
+    assert drawn == ([30, 20, 10] if oldest_on_top else [10, 20, 30])
@@ -0,0 +1,37 @@
+import pytest
+
+from swirlyswirls.particles import (MAX_SIZE, SHARD_VARIANTS, _shard_image,
+                                    circle_image_factory, image_template,
+                                    watershard_image_factory)
+
+
+@pytest.mark.parametrize('alpha, expected', [
+    (0, 0), (3.9, 0), (4, 8), (11, 8), (12, 16), (247, 248), (252, 255), (255, 255),
+])
+def test_cached_alpha_buckets(alpha, expected):
+    red_circle = image_template(circle_image_factory, 'red')
+
+    assert circle_image_factory(8, alpha, 'red').get_alpha() == expected
+    assert red_circle(8, alpha).get_alpha() == expected
+
+
+def test_cached_size_buckets():
+    assert circle_image_factory(0.3, 255).get_size() == (1, 1)
+    assert circle_image_factory(7.9, 255).get_size() == (7, 7)
+    assert circle_image_factory(MAX_SIZE * 2, 255).get_size() == (MAX_SIZE, MAX_SIZE)
+
+
+def test_shard_cache():
+    _shard_image.cache_clear()
+
+    for _ in range(50):
+        for size in range(1, MAX_SIZE + 1, 7):
+            for alpha in range(0, 256, 5):
+                surface = watershard_image_factory(size + 0.5, alpha)
+                assert surface.get_size() == (size, size)
+                assert surface.get_alpha() == alpha
+
+    # At most every variant of every size is rendered once
+    info = _shard_image.cache_info()
+    assert info.misses <= len(range(1, MAX_SIZE + 1, 7)) * SHARD_VARIANTS
+    assert info.currsize == info.misses
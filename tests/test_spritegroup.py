@@ -0,0 +1,48 @@
+import pygame
+
+from swirlyswirls.spritegroup import ReversedGroup
+
+
+def make_sprite(color, pos=(0, 0)):
+    sprite = pygame.sprite.Sprite()
+    sprite.image = pygame.Surface((4, 4))
+    sprite.image.fill(color)
+    sprite.rect = sprite.image.get_rect(topleft=pos)
+    return sprite
+
+
+def test_sprites_reversed():
+    a, b, c = (make_sprite('red') for _ in range(3))
+    group = ReversedGroup(a, b)
+
+    assert group.sprites() == [b, a]
+
+    group.add(c)
+    assert group.sprites() == [c, b, a]
+
+    group.remove(b)
+    assert group.sprites() == [c, a]
+
+
+def test_draw_order():
+    first, last = make_sprite('red'), make_sprite('blue')
+    group = ReversedGroup(first, last)
+    surface = pygame.Surface((4, 4))
+
+    group.draw(surface)
+
+    # The first sprite added is drawn last, on top
+    assert surface.get_at((0, 0)) == pygame.Color('red')
+
+
+def test_clear():
+    group = ReversedGroup(make_sprite('red', (2, 2)))
+    surface = pygame.Surface((8, 8))
+    background = pygame.Surface((8, 8))
+    background.fill('black')
+
+    group.draw(surface)
+    assert surface.get_at((3, 3)) == pygame.Color('red')
+
+    group.clear(surface, background)
+    assert surface.get_at((3, 3)) == pygame.Color('black')
@@ -0,0 +1,215 @@
+import sys
+
+import numpy as np
+import pygame
+import pytest
+
+import swirlyswirls.zones as zones
+
+from pygame import Vector2
+
+from swirlyswirls.zones import (ZoneBeam, ZoneCircle, ZoneCircleGPU, ZoneLine, ZonePoint, ZoneRect,
+                                ZoneRing)
+
+
+def test_zone_point_defaults():
+    zone = ZonePoint()
+
+    position, momentum = zone.emit()
+    assert position == Vector2(0, 0)
+    assert momentum == Vector2(0, 0)
+
+    positions, momenta = zone.emit_batch(4)
+    assert positions.shape == momenta.shape == (4, 2)
+    assert not positions.any()
+    assert not momenta.any()
+
+
+def test_zone_point_speed():
+    zone = ZonePoint(speed=10, variance=0.5)
+
+    for _ in range(100):
+        _, momentum = zone.emit()
+        assert 5 - 1e-3 <= momentum.length() <= 15 + 1e-3
+
+    _, momenta = zone.emit_batch(100)
+    lengths = np.hypot(momenta[:, 0], momenta[:, 1])
+    assert (lengths >= 5 - 1e-3).all()
+    assert (lengths <= 15 + 1e-3).all()
+
+
+def test_zone_point_batch_arguments():
+    # Ints are passed into the batch kernel as floats, vectors are rejected
+    _, momenta = ZonePoint(speed=10, phi0=0, phi1=0).emit_batch(4)
+    assert momenta.dtype == np.float32
+    assert np.allclose(momenta, (10, 0))
+
+    with pytest.raises(TypeError):
+        ZonePoint(speed=Vector2(10, 0)).emit_batch(4)
+
+
+ZONES = {
+    'point': lambda: ZonePoint(speed=10),
+    'line': lambda: ZoneLine(v=(10, 0), speed=(0, 5)),
+    'circle': lambda: ZoneCircle(r0=1, r1=5),
+    'ring': lambda: ZoneRing(r_min_t0=1, r_min_t1=2, r_max_t0=3, r_max_t1=4),
+    'rect': lambda: ZoneRect(r=pygame.Rect(0, 0, 10, 10)),
+    'rect-centered': lambda: ZoneRect(r=pygame.Rect(-5, -5, 10, 10)),
+    'beam': lambda: ZoneBeam(v=(10, 0)),
+}
+
+
+class ScalarZone(ZoneCircle):
+    """A zone without batch kernel, going through `emit_raw`."""
+    def _batchable(self):
+        return False
+
+
+@pytest.fixture(params=['default', 'numpy'])
+def kernels(request, monkeypatch):
+    if request.param == 'numpy':
+        for kernel in ('point', 'line', 'circle', 'rect', 'beam'):
+            monkeypatch.setattr(zones, f'_{kernel}_batch', getattr(zones, f'_{kernel}_batch_np'))
+
+
+@pytest.fixture(params=[*ZONES, 'scalar'])
+def zone(request, kernels):
+    if request.param == 'scalar':
+        return ScalarZone(r0=1, r1=5)
+    return ZONES[request.param]()
+
+
+@pytest.mark.parametrize('n', [0, 1, 100])
+def test_emit_batch(zone, n):
+    positions, momenta = zone.emit_batch(n, 0.5)
+
+    assert positions.shape == momenta.shape == (n, 2)
+    assert positions.dtype == momenta.dtype == np.float32
+    assert np.isfinite(positions).all()
+    assert np.isfinite(momenta).all()
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float16, np.int16])
+def test_emit_batch_dtype(zone, dtype):
+    positions, momenta = zone.emit_batch(10, 0.5, dtype=dtype)
+
+    assert positions.shape == momenta.shape == (10, 2)
+    assert positions.dtype == momenta.dtype == dtype
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float16, np.int16])
+def test_emit_to_buffers(zone, dtype):
+    pos_out = np.full((20, 2), -99, dtype=dtype)
+    mom_out = np.full((20, 2), -99, dtype=dtype)
+
+    zone.emit_to_buffers(pos_out, mom_out, 5, 10, 0.5)
+
+    for out in (pos_out, mom_out):
+        assert (out[:5] == -99).all()
+        assert (out[15:] == -99).all()
+        assert (out[5:15] != -99).all()
+
+
+def test_emit_to_buffers_direct():
+    zone = ZoneCircle(r0=1, r1=5)
+    pos_out = np.zeros((20, 2), dtype=np.float32)
+    mom_out = np.zeros((20, 2), dtype=np.float32)
+
+    zone.emit_to_buffers(pos_out, mom_out, 5, 10)
+
+    # Written in place, without allocating the zone's own position buffers
+    assert zone._capacity == -1
+    lengths = np.hypot(pos_out[5:15, 0], pos_out[5:15, 1])
+    assert ((lengths >= 1 - 1e-3) & (lengths <= 5 + 1e-3)).all()
+    assert (mom_out == pos_out).all()
+
+
+def test_zone_circle_gpu_imports_cupy_lazily():
+    assert 'cupy' not in sys.modules
+
+    try:
+        import cupy  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError, match='needs cupy'):
+            ZoneCircleGPU()
+    else:
+        assert isinstance(ZoneCircleGPU().emit_batch(4)[0], cupy.ndarray)
+
+
+@pytest.mark.parametrize('area_uniform, expected', [(True, 0.5), (False, 2 ** -0.5)])
+def test_zone_circle_area_uniform(kernels, area_uniform, expected):
+    # The share of points inside half the area of the circle
+    zone = ZoneCircle(r0=0, r1=10, area_uniform=area_uniform)
+    inner = 10 * 2 ** -0.5
+
+    positions, _ = zone.emit_batch(20000)
+    assert (np.hypot(positions[:, 0], positions[:, 1]) < inner).mean() == pytest.approx(expected, abs=0.02)
+
+    points = [zone.emit()[0].length() for _ in range(20000)]
+    assert (np.array(points) < inner).mean() == pytest.approx(expected, abs=0.02)
+
+
+def test_prepare_on_assignment(kernels):
+    zone = ZoneCircle(r0=0, r1=5)
+    zone.r1 = 20
+    zone.r0 = 10
+
+    assert zone._dr == 10
+    assert zone._r0sq == 100
+
+    positions, _ = zone.emit_batch(100)
+    lengths = np.hypot(positions[:, 0], positions[:, 1])
+    assert ((lengths >= 10 - 1e-3) & (lengths <= 20 + 1e-3)).all()
+    for _ in range(100):
+        assert 10 - 1e-3 <= zone.emit()[0].length() <= 20 + 1e-3
+
+
+def test_prepare_on_beam_assignment(kernels):
+    zone = ZoneBeam(v=(10, 0), width=0)
+    zone.v = Vector2(0, 30)
+
+    assert (zone._vx, zone._vy) == (0, 30)
+    assert (zone._nx, zone._ny) == (0, 100)
+
+    positions, momenta = zone.emit_batch(100)
+    assert (positions[:, 0] == 0).all()
+    assert ((positions[:, 1] >= 0) & (positions[:, 1] <= 30)).all()
+    assert np.allclose(momenta, (0, 100))
+    position, momentum = zone.emit()
+    assert position.x == 0 and 0 <= position.y <= 30
+    assert momentum == Vector2(0, 100)
+
+
+@pytest.mark.parametrize('make', [
+    lambda number: ZoneCircle(r0=number(1), r1=number(5), phi0=number(0), phi1=number(90)),
+    lambda number: ZoneRing(r_min_t0=number(1), r_min_t1=number(2),
+                            r_max_t0=number(3), r_max_t1=number(4)),
+    lambda number: ZoneRect(r=pygame.Rect(number(0), number(0), number(10), number(10))),
+    lambda number: ZoneLine(v=(number(10), 0), speed=(0, number(5)), variance=number(0)),
+    lambda number: ZonePoint(speed=number(10), variance=number(0)),
+])
+def test_kernel_arguments_are_floats(monkeypatch, make):
+    # Ints and floats end up as the same kernel arguments, so numba doesn't
+    # compile a separate version for every mix of them
+    calls = []
+
+    def recording(kernel):
+        def wrapper(positions, momenta, rnd, *args):
+            calls.append(tuple(type(arg) for arg in args))
+            return kernel(positions, momenta, rnd, *args)
+        return wrapper
+
+    for kernel in ('point', 'line', 'circle', 'rect', 'beam'):
+        name = f'_{kernel}_batch'
+        monkeypatch.setattr(zones, name, recording(getattr(zones, name)))
+
+    make(int).emit_batch(4, 0.5)
+    make(float).emit_batch(4, 0.5)
+
+    assert calls[0] == calls[1]
+    assert set(calls[0]) <= {float, bool}
+
+
+def test_kernel_arguments_rejects_vectors():
+    with pytest.raises(TypeError):
+        ZoneCircle(r1=Vector2(5, 5)).emit_batch(4)